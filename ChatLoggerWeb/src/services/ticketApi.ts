@@ -137,6 +137,8 @@ class TicketApiService {
     if (filters?.sla_breached !== undefined) params.append('sla_breached', String(filters.sla_breached))
     if (filters?.page) params.append('page', String(filters.page))
     if (filters?.limit) params.append('limit', String(filters.limit))
+    if (filters?.cursor) params.append('cursor', filters.cursor)
+    if (filters?.include_total === false) params.append('include_total', 'false')
 
     const { data } = await this.api.get<TicketListResponse>(`/v1/tickets?${params.toString()}`)
     return data
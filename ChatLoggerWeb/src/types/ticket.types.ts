@@ -66,8 +66,10 @@ export interface Ticket {
 export interface TicketListResponse {
   ok: boolean
   tickets: Ticket[]
-  total: number
+  total: number | null
   page: number
+  has_more?: boolean
+  next_cursor?: string | null
 }
 
 export interface TicketDetailResponse {
@@ -129,6 +131,8 @@ export interface TicketFilters {
   sla_breached?: boolean
   page?: number
   limit?: number
+  cursor?: string
+  include_total?: boolean
 }
 
 // API Error
@@ -167,6 +171,8 @@ export interface TemplateUpdate {
 export interface TemplateListResponse {
   ok: boolean
   templates: Template[]
+  has_more?: boolean
+  next_cursor?: string | null
 }
 
 export interface TemplateResponse {
@@ -6,12 +6,104 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
+import logging
+import logging.handlers
+import math
+import queue
+import sys
 import time
 import httpx
-from datetime import datetime
-import pytz
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+# Korea has no DST, so a fixed +09:00 offset is exact (and cheaper than a pytz zone)
+KST = timezone(timedelta(hours=9))
+
+logger = logging.getLogger("bridge")
+
+
+def setup_logging(log_file: str = None) -> logging.handlers.QueueListener:
+    """Route bridge logs through a queue so the poll loop never blocks on stdout/disk.
+
+    A QueueListener thread drains the queue to stdout (and a rotating file if given).
+    """
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        handlers.append(
+            logging.handlers.RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5)
+        )
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
+
+
+class SeenMessageFilter:
+    """Bounded-memory dedup set for message keys.
+
+    Recent keys live in a small exact LRU, so steady-state polls (which keep
+    returning the same recent messages) never touch the Bloom filter behind it.
+    The Bloom filter remembers older keys in two generations of bits: once the
+    current generation holds `capacity` keys it becomes the previous one and a
+    fresh generation starts, so memory stays fixed no matter how long the bridge
+    runs. A false positive only skips a push; the Ingest API still dedups.
+
+    At the defaults (100k keys, 1e-4) a generation is ~1.9M bits (~240 KB,
+    13 hashes); the previous generation is only allocated on first rotation.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-4, recent_size: int = 10_000):
+        self.capacity = capacity
+        self.recent_size = recent_size
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._recent = OrderedDict()
+        self._current = bytearray((self.num_bits + 7) // 8)
+        self._previous = None
+        self._count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    @staticmethod
+    def _has_all(bits: bytearray, positions) -> bool:
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return True
+        positions = self._positions(key)
+        return self._has_all(self._current, positions) or (
+            self._previous is not None and self._has_all(self._previous, positions)
+        )
+
+    def add(self, key: str):
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.recent_size:
+            self._recent.popitem(last=False)
+
+        if self._count >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(len(self._previous))
+            self._count = 0
+        for pos in self._positions(key):
+            self._current[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
 
-KST = pytz.timezone("Asia/Seoul")
 
 class AndroidBridge:
     def __init__(self, android_ip: str, server_url: str, device_key: str):
@@ -19,20 +111,40 @@ class AndroidBridge:
         self.server_url = server_url
         self.device_key = device_key
         self.last_sync_time = 0
-        self.seen_messages = set()
+        self.seen_messages = SeenMessageFilter()
+
+        # Reuse keep-alive connections across polls instead of a new TCP handshake per request
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        self.android_client = httpx.AsyncClient(
+            base_url=self.android_url, limits=limits, timeout=10.0
+        )
+        self.server_client = httpx.AsyncClient(
+            base_url=self.server_url,
+            headers={
+                "Content-Type": "application/json",
+                "X-Device-Key": self.device_key
+            },
+            limits=limits,
+            timeout=10.0
+        )
+
+    async def close(self):
+        """Close pooled HTTP clients"""
+        await self.android_client.aclose()
+        await self.server_client.aclose()
 
-    def get_android_messages(self):
+    async def get_android_messages(self):
         """Fetch all messages from Android app"""
         try:
-            response = httpx.get(f"{self.android_url}/api/sync", timeout=10)
+            response = await self.android_client.get("/api/sync")
             if response.is_success:
                 return response.json()
             return None
         except Exception as e:
-            print(f"[ERROR] Failed to fetch from Android: {e}")
+            logger.error("[ERROR] Failed to fetch from Android: %s", e)
             return None
 
-    def push_to_server(self, room_name: str, sender: str, message: str, timestamp: int):
+    async def push_to_server(self, room_name: str, sender: str, message: str, timestamp: int):
         """Push message to Ingest API"""
         try:
             # Convert timestamp to ISO format
@@ -47,41 +159,37 @@ class AndroidBridge:
                 "received_at": received_at
             }
 
-            response = httpx.post(
-                f"{self.server_url}/v1/events",
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Device-Key": self.device_key
-                },
-                timeout=10
-            )
+            response = await self.server_client.post("/v1/events", json=payload)
 
             if response.is_success:
                 data = response.json()
                 if data.get("deduped"):
-                    print(f"[SKIP] Duplicate: {room_name} - {sender}: {message[:30]}...")
+                    logger.info("[SKIP] Duplicate: %s - %s: %.30s...", room_name, sender, message)
                 else:
-                    print(f"[OK] Sent: {room_name} - {sender}: {message[:30]}...")
+                    logger.info("[OK] Sent: %s - %s: %.30s...", room_name, sender, message)
                 return True
             else:
-                print(f"[ERROR] Server returned {response.status_code}: {response.text}")
+                logger.error("[ERROR] Server returned %s: %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"[ERROR] Failed to push to server: {e}")
+            logger.error("[ERROR] Failed to push to server: %s", e)
             return False
 
-    def sync(self):
+    async def sync(self):
         """Sync messages from Android to server"""
-        data = self.get_android_messages()
+        data = await self.get_android_messages()
         if not data:
             return 0
 
         rooms = {r["id"]: r["roomName"] for r in data.get("rooms", [])}
         messages = data.get("messages", [])
 
-        new_count = 0
+        # Only sync recent messages (last 5 minutes on first run, then all new)
+        cutoff = int(time.time() * 1000) - (5 * 60 * 1000) if self.last_sync_time == 0 else None
+
+        pending_keys = []
+        tasks = []
         for msg in messages:
             # Create unique key for dedup
             msg_key = f"{msg['roomId']}:{msg['timestamp']}:{msg['body'][:50]}"
@@ -89,45 +197,52 @@ class AndroidBridge:
             if msg_key in self.seen_messages:
                 continue
 
-            # Only sync recent messages (last 5 minutes on first run, then all new)
-            if self.last_sync_time == 0:
-                cutoff = int(time.time() * 1000) - (5 * 60 * 1000)  # 5 minutes ago
-                if msg["timestamp"] < cutoff:
-                    self.seen_messages.add(msg_key)
-                    continue
+            # Pre-start history is marked seen so later syncs skip it too; anything
+            # unseen after the first sync (e.g. backfilled on reconnect) is pushed
+            if cutoff is not None and msg["timestamp"] < cutoff:
+                self.seen_messages.add(msg_key)
+                continue
 
             room_name = rooms.get(msg["roomId"], "Unknown")
             sender = msg.get("sender", "Unknown")
             body = msg.get("body", "")
             timestamp = msg.get("timestamp", int(time.time() * 1000))
 
-            if self.push_to_server(room_name, sender, body, timestamp):
+            pending_keys.append(msg_key)
+            tasks.append(self.push_to_server(room_name, sender, body, timestamp))
+
+        # Push all new messages concurrently; mark seen only after every push settles
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        new_count = 0
+        for msg_key, result in zip(pending_keys, results):
+            if result is True:
                 self.seen_messages.add(msg_key)
                 new_count += 1
 
         self.last_sync_time = int(time.time() * 1000)
         return new_count
 
-    def run(self, interval: int = 3):
+    async def run(self, interval: int = 3):
         """Run bridge loop"""
-        print(f"[Bridge] Starting bridge...")
-        print(f"[Bridge] Android: {self.android_url}")
-        print(f"[Bridge] Server: {self.server_url}")
-        print(f"[Bridge] Polling interval: {interval}s")
-        print("-" * 50)
-
-        while True:
-            try:
-                new_count = self.sync()
-                if new_count > 0:
-                    print(f"[Bridge] Synced {new_count} new messages")
-            except KeyboardInterrupt:
-                print("\n[Bridge] Stopping...")
-                break
-            except Exception as e:
-                print(f"[Bridge] Error: {e}")
-
-            time.sleep(interval)
+        logger.info("[Bridge] Starting bridge...")
+        logger.info("[Bridge] Android: %s", self.android_url)
+        logger.info("[Bridge] Server: %s", self.server_url)
+        logger.info("[Bridge] Polling interval: %ss", interval)
+        logger.info("-" * 50)
+
+        try:
+            while True:
+                try:
+                    new_count = await self.sync()
+                    if new_count > 0:
+                        logger.info("[Bridge] Synced %d new messages", new_count)
+                except Exception as e:
+                    logger.error("[Bridge] Error: %s", e)
+
+                await asyncio.sleep(interval)
+        finally:
+            await self.close()
 
 
 def main():
@@ -136,8 +251,10 @@ def main():
     parser.add_argument("--server-url", default="http://localhost:8001", help="Ingest API URL")
     parser.add_argument("--device-key", default="shared-secret-for-android", help="Device key")
     parser.add_argument("--interval", type=int, default=3, help="Polling interval in seconds")
+    parser.add_argument("--log-file", default=None, help="Also write logs to this rotating file")
 
     args = parser.parse_args()
+    listener = setup_logging(args.log_file)
 
     bridge = AndroidBridge(
         android_ip=args.android_ip,
@@ -145,7 +262,12 @@ def main():
         device_key=args.device_key
     )
 
-    bridge.run(interval=args.interval)
+    try:
+        asyncio.run(bridge.run(interval=args.interval))
+    except KeyboardInterrupt:
+        logger.info("[Bridge] Stopping...")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -2,15 +2,20 @@
 Authentication utilities for Dashboard API
 """
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional
 
 import hashlib
+import hmac
+import threading
+import time
 
 import bcrypt
-from fastapi import Depends, HTTPException, status
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from shared.database import get_db
@@ -19,11 +24,51 @@ from shared.config import get_settings
 
 settings = get_settings()
 
+# Recently verified tokens (blake2b digest -> payload); entries also honour the token's exp
+_decoded_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_decoded_tokens_lock = threading.Lock()
+
+# Default access token lifetime in seconds
+_DEFAULT_TOKEN_TTL_SEC = settings.access_token_expire_minutes * 60
+
 # JWT Bearer scheme
 security = HTTPBearer()
 
+# User lookups built once; SQLAlchemy reuses the compiled form on every call
+_GET_USER_BY_ID_STMT = select(User).where(User.id == bindparam("user_id"))
+_GET_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+
+# Recently verified (password HMAC, stored hash) pairs - skips repeat bcrypt work.
+# Keyed on the stored hash too, so a password change invalidates the entry.
+_verified_passwords: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_verified_passwords_lock = threading.Lock()
+
+# Compared against when the email is unknown, so that path costs one bcrypt check too
+_DUMMY_PASSWORD_HASH = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(settings.bcrypt_rounds))
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password, caching successful checks for a short TTL.
+
+    The raw password is never stored; the cache key is an HMAC of it.
+    """
+    cache_key = (
+        hmac.new(settings.jwt_secret.encode(), plain_password.encode("utf-8"), "sha256").digest(),
+        hashed_password,
+    )
+    with _verified_passwords_lock:
+        if cache_key in _verified_passwords:
+            return True
+
+    if not _check_password(plain_password, hashed_password):
+        return False
+
+    with _verified_passwords_lock:
+        _verified_passwords[cache_key] = True
+    return True
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its bcrypt hash.
 
     Also accepts legacy SHA256 hashes for backward compatibility
@@ -45,34 +90,62 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     """Generate bcrypt password hash."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(settings.bcrypt_rounds)
+    ).decode("utf-8")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True for legacy SHA256 hashes and bcrypt hashes at another cost factor."""
+    if not hashed_password.startswith("$2b$"):
+        return True
+    # bcrypt format: $2b$<cost>$<salt+hash>
+    try:
+        return int(hashed_password.split("$")[2]) != settings.bcrypt_rounds
+    except (IndexError, ValueError):
+        return True
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
-    expire = datetime.utcnow() + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
-    to_encode.update({"exp": expire})
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _DEFAULT_TOKEN_TTL_SEC
+    # JWT exp is a NumericDate (integer epoch seconds)
+    to_encode["exp"] = int(time.time()) + ttl
     return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
 def decode_token(token: str) -> dict:
-    """Decode and validate JWT token"""
+    """Decode and validate JWT token (verified payloads are cached for up to 60s)"""
+    cache_key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    with _decoded_tokens_lock:
+        payload = _decoded_tokens.get(cache_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"ok": False, "error": {"code": "UNAUTHORIZED", "message": "Invalid or expired token"}}
         )
 
+    with _decoded_tokens_lock:
+        _decoded_tokens[cache_key] = payload
+    return payload
 
-async def get_current_user(
+
+def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
-    """Get current user from JWT token"""
+    """Get current user from JWT token (resolved once per request)"""
+    cached_user = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+
     token = credentials.credentials
     payload = decode_token(token)
 
@@ -83,29 +156,32 @@ async def get_current_user(
             detail={"ok": False, "error": {"code": "UNAUTHORIZED", "message": "Invalid token payload"}}
         )
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user = db.execute(_GET_USER_BY_ID_STMT, {"user_id": int(user_id)}).scalar_one_or_none()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"ok": False, "error": {"code": "UNAUTHORIZED", "message": "User not found"}}
         )
 
+    request.state.user = user
     return user
 
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate user with email and password.
 
-    Auto-upgrades legacy SHA256 hashes to bcrypt on successful login.
+    Auto-upgrades legacy SHA256 hashes, and bcrypt hashes made with a
+    different cost factor, to the current bcrypt settings on successful login.
     """
-    user = db.query(User).filter(User.email == email).first()
+    user = db.execute(_GET_USER_BY_EMAIL_STMT, {"email": email}).scalars().first()
     if not user:
+        bcrypt.checkpw(password.encode("utf-8"), _DUMMY_PASSWORD_HASH)
         return None
     if not verify_password(password, user.password_hash):
         return None
 
-    # Auto-upgrade legacy SHA256 hash to bcrypt
-    if not user.password_hash.startswith("$2b$"):
+    # Auto-upgrade legacy SHA256 / outdated-cost hashes
+    if password_needs_rehash(user.password_hash):
         user.password_hash = get_password_hash(password)
         db.commit()
 
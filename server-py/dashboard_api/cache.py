@@ -0,0 +1,89 @@
+"""
+In-process response cache for Dashboard API aggregate endpoints
+
+The dashboard polls a few global aggregate endpoints on a timer. Their
+data changes on the order of seconds, so a short TTL per process removes
+most of the repeated query work without any external cache service.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from cachetools import TTLCache
+
+
+class ResponseCache:
+    """Thread-safe TTL cache for computed endpoint responses"""
+
+    def __init__(self, ttl: float, maxsize: int = 64):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        # Per-key [lock, waiter count] for in-flight computations, and a counter
+        # bumped by clear(); an entry is dropped only when its last waiter leaves
+        self._inflight: dict[Hashable, list] = {}
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value, computing it at most once at a time per key.
+
+        Concurrent misses wait for the first caller's result instead of all
+        running the same queries. A value computed across a clear() is returned
+        to its callers but not cached, so an invalidation is never overwritten.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            entry = self._inflight.get(key)
+            if entry is None:
+                entry = self._inflight[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                with self._lock:
+                    value = self._cache.get(key)
+                    generation = self._generation
+                if value is not None:
+                    return value
+                value = compute()
+                with self._lock:
+                    if generation == self._generation:
+                        self._cache[key] = value
+                return value
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._inflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
+
+
+# Global dashboard aggregates (same for every user)
+metrics_cache = ResponseCache(ttl=30)
+clinics_health_cache = ResponseCache(ttl=20)
+# Feedback statistics (global); the learning worker marks feedback applied from
+# another process, so that change shows up within the TTL
+feedback_stats_cache = ResponseCache(ttl=60)
+
+
+def invalidate_dashboard_aggregates() -> None:
+    """Drop cached aggregates after a ticket write in this process.
+
+    Other processes still serve their copy until the TTL expires.
+    """
+    metrics_cache.clear()
+    clinics_health_cache.clear()
@@ -1,20 +1,30 @@
 import os
+import asyncio
+import base64
+import hashlib
 import httpx
+import orjson
 import threading
 import logging
+from collections import Counter
 from uuid import UUID
 from datetime import datetime
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI, Depends, HTTPException, Query, status
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, case
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, load_only, raiseload
+from sqlalchemy import bindparam, delete, func, or_, and_, case, cast, false, select, true, tuple_, update, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
 
-from shared.database import get_db, engine, Base
+from shared.database import get_db, engine, Base, SessionLocal, query_source
 from shared.models import (
     User,
     Ticket,
@@ -27,6 +37,7 @@ from shared.models import (
     MessageTemplate,
     ClassificationFeedback,
     PatternApplicationLog,
+    SLAAlertLog,
     StaffResponseLog,
     StaffResponseAnalysis,
     StaffAnalysisExecution,
@@ -49,9 +60,7 @@ from shared.schemas import (
     TicketUpdate,
     TicketEventItem,
     TicketEventResponse,
-    MetricsData,
     MetricsResponse,
-    ClinicHealth,
     ClinicHealthResponse,
     NotificationItem,
     NotificationListResponse,
@@ -88,14 +97,21 @@ from shared.schemas import (
     PatternApplyResponse,
     InsightsResponse,
 )
-from shared.utils import get_kst_now, calculate_sla_remaining_sec
+from shared.utils import KST_UTC_OFFSET_SEC, get_kst_now, get_kst_today_start
 from shared.config import get_settings
-from shared.migrations import run_column_migrations, run_table_migrations
+from shared.migrations import (
+    run_column_migrations,
+    run_table_migrations,
+)
 from shared.constants import (
-    TEMPLATE_CATEGORIES,
-    TICKET_STATUSES,
-    TICKET_PRIORITIES,
-    USER_ROLES,
+    TEMPLATE_CATEGORY_SET,
+    TEMPLATE_CATEGORIES_DISPLAY,
+    TICKET_STATUS_SET,
+    TICKET_STATUSES_DISPLAY,
+    TICKET_PRIORITY_SET,
+    TICKET_PRIORITIES_DISPLAY,
+    USER_ROLE_SET,
+    USER_ROLES_DISPLAY,
 )
 
 from .auth import (
@@ -105,14 +121,120 @@ from .auth import (
     get_admin_user,
     get_password_hash,
 )
+from .cache import (
+    metrics_cache,
+    clinics_health_cache,
+    feedback_stats_cache,
+    invalidate_dashboard_aggregates,
+)
 
 settings = get_settings()
 
+# Response fields for hot list endpoints that emit plain dicts straight to orjson
+TICKET_ITEM_FIELDS = tuple(TicketItem.model_fields)
+TICKET_EVENT_ITEM_FIELDS = tuple(TicketEventItem.model_fields)
+USER_INFO_FIELDS = tuple(UserInfo.model_fields)
+NOTIFICATION_ITEM_FIELDS = tuple(NotificationItem.model_fields)
+TEMPLATE_ITEM_FIELDS = tuple(TemplateItem.model_fields)
+FEEDBACK_ITEM_FIELDS = tuple(FeedbackItem.model_fields)
+PATTERN_ITEM_FIELDS = tuple(PatternItem.model_fields)
+
+
+def _rows_to_dicts(rows, fields: tuple[str, ...]) -> list[dict]:
+    """Project ORM objects / result rows onto response fields.
+
+    List endpoints return these via ORJSONResponse, skipping per-row model
+    construction and FastAPI's response_model re-validation; the decorators
+    keep response_model for the OpenAPI schema.
+    """
+    return [{field: getattr(row, field) for field in fields} for row in rows]
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _with_etag(response: Response) -> Response:
+    """Tag a fully rendered response with a strong ETag of its body."""
+    response.headers["ETag"] = f'"{hashlib.blake2b(response.body, digest_size=16).hexdigest()}"'
+    return response
+
+
+def _not_modified_or(request: Request, response: Response) -> Response:
+    """Answer 304 (no body) when If-None-Match already names the response's ETag."""
+    etag = response.headers["ETag"]
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return response
+
+
+def _wants_ndjson(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _ndjson_stream(build_query, fields: tuple[str, ...], batch_size: int = 200):
+    """Yield one orjson-encoded row per line, fetching rows in batches.
+
+    The request-scoped session from get_db is closed before a streaming body
+    is sent, so the generator runs the query in its own session.
+    """
+    db = SessionLocal()
+    try:
+        for row in build_query(db).yield_per(batch_size):
+            yield orjson.dumps({field: getattr(row, field) for field in fields}) + b"\n"
+    finally:
+        db.close()
+
+
+def _bootstrap_admin_user(db: Session) -> None:
+    """Ensure the 'admin' account exists with the admin role.
+
+    The common restart case (account already exists) is a single UPDATE; only
+    a fresh database pays for the bcrypt hash and the idempotent insert.
+    """
+    promoted = (
+        db.query(User)
+        .filter(User.email == "admin")
+        .update({User.role: "admin"}, synchronize_session=False)
+    )
+    if promoted:
+        db.commit()
+        return
+
+    default_admin_pw = os.environ.get("ADMIN_DEFAULT_PASSWORD", "")
+    if not default_admin_pw:
+        if os.environ.get("ENV", "").lower() in ("production", "prod"):
+            raise RuntimeError(
+                "FATAL: ADMIN_DEFAULT_PASSWORD is not set. "
+                "Set the ADMIN_DEFAULT_PASSWORD environment variable before running in production."
+            )
+        default_admin_pw = "1234"
+        logger.warning("Admin bootstrap uses default password '1234' for a new account. Set ADMIN_DEFAULT_PASSWORD env var for production.")
+
+    # ON CONFLICT DO NOTHING: another worker process may have created it meanwhile
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    stmt = (
+        insert(User)
+        .values(
+            email="admin",
+            password_hash=get_password_hash(default_admin_pw),
+            name="관리자",
+            role="admin",
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+    )
+    db.execute(stmt)
+    db.commit()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create tables if not exist
-    Base.metadata.create_all(bind=engine)
+    if settings.db_create_all:
+        Base.metadata.create_all(bind=engine)
 
     # Run migrations for new columns
     db = next(get_db())
@@ -120,9 +242,7 @@ async def lifespan(app: FastAPI):
         run_column_migrations(db)
         run_table_migrations(db)
     except Exception as e:
-        import logging
         import traceback
-        logger = logging.getLogger(__name__)
         logger.error(f"[CRITICAL] Migration failed: {e}")
         logger.error(traceback.format_exc())
     finally:
@@ -131,37 +251,16 @@ async def lifespan(app: FastAPI):
     # Create admin user if not exists, or update existing to admin role
     db = next(get_db())
     try:
-        admin = db.query(User).filter(User.email == "admin").first()
-        if not admin:
-            is_production = os.environ.get("ENV", "").lower() in ("production", "prod")
-            default_admin_pw = os.environ.get("ADMIN_DEFAULT_PASSWORD", "")
-
-            if not default_admin_pw:
-                if is_production:
-                    raise RuntimeError(
-                        "FATAL: ADMIN_DEFAULT_PASSWORD is not set. "
-                        "Set the ADMIN_DEFAULT_PASSWORD environment variable before running in production."
-                    )
-                default_admin_pw = "1234"
-                logger.warning("Admin created with default password '1234'. Set ADMIN_DEFAULT_PASSWORD env var for production.")
-
-            admin = User(
-                email="admin",
-                password_hash=get_password_hash(default_admin_pw),
-                name="관리자",
-                role="admin",
-            )
-            db.add(admin)
-            db.commit()
-        elif admin.role != "admin":
-            # Ensure existing admin account has admin role
-            admin.role = "admin"
-            db.commit()
+        _bootstrap_admin_user(db)
     finally:
         db.close()
 
+    # Shared HTTP client for worker calls (keep-alive pool, no handshake per request)
+    app.state.http = httpx.AsyncClient(timeout=10.0)
+
     yield
     # Shutdown
+    await app.state.http.aclose()
 
 
 app = FastAPI(
@@ -169,6 +268,7 @@ app = FastAPI(
     description="Serves web dashboard for CS management",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -181,6 +281,22 @@ app.add_middleware(
 )
 
 
+class QuerySourceMiddleware:
+    """Tag DB queries issued while handling a request with its method and path,
+    so slow-query log lines point at the endpoint"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            query_source.set(f"{scope['method']} {scope['path']}")
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(QuerySourceMiddleware)
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -193,7 +309,7 @@ async def health_check():
 
 
 @app.post("/auth/login", response_model=LoginResponse)
-async def login(request: LoginRequest, db: Session = Depends(get_db)):
+def login(request: LoginRequest, db: Session = Depends(get_db)):
     """User login"""
     user = authenticate_user(db, request.email, request.password)
     if not user:
@@ -222,67 +338,65 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @app.get("/v1/users", response_model=UserListResponse)
-async def list_users(
+def list_users(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """List all users (any authenticated user can view)"""
-    users = db.query(User).order_by(User.id).all()
-    return UserListResponse(
-        ok=True,
-        users=[
-            UserInfo(id=u.id, email=u.email, name=u.name, role=u.role) for u in users
-        ],
-    )
+    rows = db.query(User.id, User.email, User.name, User.role).order_by(User.id).all()
+    return ORJSONResponse({"ok": True, "users": _rows_to_dicts(rows, USER_INFO_FIELDS)})
 
 
 @app.post("/v1/users", response_model=UserResponse)
-async def create_user(
+def create_user(
     request: UserCreate,
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user),  # Admin only
 ):
     """Create new user (admin only)"""
-    # Check if email exists
-    existing = db.query(User).filter(User.email == request.email).first()
-    if existing:
+    if request.role not in USER_ROLE_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "ok": False,
-                "error": {"code": "DUPLICATE", "message": "Email already exists"},
+                "error": {
+                    "code": "VALIDATION_ERROR",
+                    "message": f"Invalid role. Must be one of: {USER_ROLES_DISPLAY}",
+                },
             },
         )
 
-    if request.role not in USER_ROLES:
+    # The unique email index decides duplicates atomically: no SELECT-then-INSERT race
+    insert = sqlite_insert if db.bind.dialect.name == "sqlite" else pg_insert
+    user_id = db.execute(
+        insert(User)
+        .values(
+            email=request.email,
+            password_hash=get_password_hash(request.password),
+            name=request.name,
+            role=request.role,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id)
+    ).scalar()
+    if user_id is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "ok": False,
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": f"Invalid role. Must be one of: {', '.join(USER_ROLES)}",
-                },
+                "error": {"code": "DUPLICATE", "message": "Email already exists"},
             },
         )
-
-    user = User(
-        email=request.email,
-        password_hash=get_password_hash(request.password),
-        name=request.name,
-        role=request.role,
-    )
-    db.add(user)
     db.commit()
-    db.refresh(user)
 
     return UserResponse(
         ok=True,
-        user=UserInfo(id=user.id, email=user.email, name=user.name, role=user.role),
+        user=UserInfo(id=user_id, email=request.email, name=request.name, role=request.role),
     )
 
 
 @app.put("/v1/users/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     request: UserUpdate,
     db: Session = Depends(get_db),
@@ -314,20 +428,7 @@ async def update_user(
 
     # Update fields
     if request.email is not None:
-        # Check for duplicate email
-        existing = (
-            db.query(User)
-            .filter(User.email == request.email, User.id != user_id)
-            .first()
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "ok": False,
-                    "error": {"code": "DUPLICATE", "message": "Email already exists"},
-                },
-            )
+        # Duplicates are rejected by the unique email index at commit time
         user.email = request.email
 
     if request.password is not None:
@@ -337,20 +438,30 @@ async def update_user(
         user.name = request.name
 
     if request.role is not None:
-        if request.role not in USER_ROLES:
+        if request.role not in USER_ROLE_SET:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "ok": False,
                     "error": {
                         "code": "VALIDATION_ERROR",
-                        "message": f"Invalid role. Must be one of: {', '.join(USER_ROLES)}",
+                        "message": f"Invalid role. Must be one of: {USER_ROLES_DISPLAY}",
                     },
                 },
             )
         user.role = request.role
 
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "ok": False,
+                "error": {"code": "DUPLICATE", "message": "Email already exists"},
+            },
+        ) from None
     db.refresh(user)
 
     return UserResponse(
@@ -360,7 +471,7 @@ async def update_user(
 
 
 @app.delete("/v1/users/{user_id}", response_model=UserDeleteResponse)
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user),  # Admin only
@@ -413,98 +524,211 @@ async def delete_user(
 # ============================================
 
 
+# Columns backing TicketItem - list_tickets skips next_action and other unused fields
+TICKET_ITEM_COLUMNS = (
+    Ticket.ticket_id,
+    Ticket.clinic_key,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.topic_primary,
+    Ticket.summary_latest,
+    Ticket.intent,
+    Ticket.first_inbound_at,
+    Ticket.last_inbound_at,
+    Ticket.last_outbound_at,
+    Ticket.last_message_sender,
+    # Rows created before the needs_reply migration may still hold NULL
+    func.coalesce(Ticket.needs_reply, true()).label("needs_reply"),
+    Ticket.sla_breached,
+)
+
+
+def _sla_remaining_sec_expr(sla_minutes: int, dialect_name: str):
+    """SQL equivalent of calculate_sla_remaining_sec, evaluated per row in the SELECT"""
+    now_epoch = get_kst_now().timestamp()
+    inbound_epoch = func.extract("epoch", Ticket.first_inbound_at)
+    if dialect_name == "sqlite":
+        # SQLite keeps naive KST wall-clock values and STRFTIME('%s') reads them
+        # as UTC; shift back so naive values mean KST, as in calculate_sla_remaining_sec
+        inbound_epoch = inbound_epoch - KST_UTC_OFFSET_SEC
+    remaining = inbound_epoch + sla_minutes * 60 - now_epoch
+    return case(
+        (Ticket.first_inbound_at.is_(None) | Ticket.first_response_sec.isnot(None), None),
+        else_=cast(remaining, Integer),
+    ).label("sla_remaining_sec")
+
+
+def _encode_ticket_cursor(row) -> str:
+    """Opaque keyset cursor for the ticket list sort key of `row`"""
+    key = [row.sla_breached, row.priority_rank, row.updated_at.isoformat(), str(row.ticket_id)]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode("ascii")
+
+
+def _ticket_cursor_filter(cursor: str):
+    """WHERE clause selecting the rows after `cursor` in list_tickets order"""
+    try:
+        sla_breached, priority_rank, updated_at, ticket_id = orjson.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        sla_breached = bool(sla_breached)
+        priority_rank = int(priority_rank)
+        updated_at = datetime.fromisoformat(updated_at)
+        ticket_id = UUID(ticket_id)
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "ok": False,
+                "error": {"code": "VALIDATION_ERROR", "message": "Invalid cursor"},
+            },
+        ) from None
+
+    # (sla_breached DESC, priority_rank ASC, updated_at DESC, ticket_id ASC) > cursor;
+    # only non-breached tickets sort after a breached one
+    return or_(
+        Ticket.sla_breached.is_(False) if sla_breached else false(),
+        and_(
+            Ticket.sla_breached == sla_breached,
+            or_(
+                Ticket.priority_rank > priority_rank,
+                and_(
+                    Ticket.priority_rank == priority_rank,
+                    or_(
+                        Ticket.updated_at < updated_at,
+                        and_(Ticket.updated_at == updated_at, Ticket.ticket_id > ticket_id),
+                    ),
+                ),
+            ),
+        ),
+    )
+
+
 @app.get("/v1/tickets", response_model=TicketListResponse)
-async def list_tickets(
+def list_tickets(
+    request: Request,
     status: Optional[str] = Query(None, description="Comma-separated statuses"),
     priority: Optional[str] = Query(None, description="Comma-separated priorities"),
     clinic_key: Optional[str] = None,
     sla_breached: Optional[bool] = None,
     page: Optional[int] = Query(None, ge=1),
     limit: Optional[int] = Query(200, ge=1, le=1000),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (keyset pagination; overrides page)"),
+    include_total: bool = Query(True, description="Count all matching tickets (false skips the count; total is null)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List tickets with filters"""
-    query = db.query(Ticket)
+    """List tickets with filters
 
+    Send `Accept: application/x-ndjson` to stream the page one ticket per line.
+    """
     # Apply filters
+    filters = []
     if status:
         statuses = [s.strip() for s in status.split(",")]
-        query = query.filter(Ticket.status.in_(statuses))
+        filters.append(Ticket.status.in_(statuses))
 
     if priority:
         priorities = [p.strip() for p in priority.split(",")]
-        query = query.filter(Ticket.priority.in_(priorities))
+        filters.append(Ticket.priority.in_(priorities))
 
     if clinic_key:
-        query = query.filter(Ticket.clinic_key == clinic_key)
+        filters.append(Ticket.clinic_key == clinic_key)
 
     if sla_breached is not None:
-        query = query.filter(Ticket.sla_breached == sla_breached)
-
-    # Get total count
-    total = query.count()
-
-    # Order: SLA breached first, then by priority, then by updated_at
-    # Use CASE statement for cross-database compatibility (SQLite + PostgreSQL)
-    from sqlalchemy import case
+        filters.append(Ticket.sla_breached == sla_breached)
+
+    # Keyset pagination: an index range scan from the cursor, no OFFSET
+    keyset_filter = _ticket_cursor_filter(cursor) if cursor else None
+    offset = ((page or 1) - 1) * limit if limit and not cursor else 0
+
+    def build_page_query(session: Session, with_total: bool = False, lookahead: int = 0):
+        query = session.query(
+            *TICKET_ITEM_COLUMNS,
+            Ticket.priority_rank,
+            Ticket.updated_at,
+            # SLA remaining is computed by the database alongside each row
+            _sla_remaining_sec_expr(
+                settings.sla_threshold_minutes, session.bind.dialect.name
+            ),
+        ).filter(*filters)
+        if keyset_filter is not None:
+            query = query.filter(keyset_filter)
+        if with_total:
+            # The total comes from a window count so the page and count share one query
+            query = query.add_columns(func.count().over().label("total"))
+
+        # Order: SLA breached first, then by priority, then by updated_at, with
+        # ticket_id as a tiebreaker so pages are deterministic
+        # (matches ix_ticket_list_order so the sort can be served by the index)
+        query = query.order_by(
+            Ticket.sla_breached.desc(),
+            Ticket.priority_rank,
+            Ticket.updated_at.desc(),
+            Ticket.ticket_id,
+        )
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit + lookahead)
+        return query
+
+    if _wants_ndjson(request):
+        return StreamingResponse(
+            _ndjson_stream(build_page_query, TICKET_ITEM_FIELDS), media_type=NDJSON_MEDIA_TYPE
+        )
 
-    priority_order = case(
-        (Ticket.priority == "urgent", 0),
-        (Ticket.priority == "high", 1),
-        (Ticket.priority == "normal", 2),
-        (Ticket.priority == "low", 3),
-        else_=4,
-    )
-    query = query.order_by(
-        Ticket.sla_breached.desc(), priority_order, Ticket.updated_at.desc()
-    )
+    def count_filtered() -> int:
+        return db.query(func.count()).select_from(Ticket).filter(*filters).scalar()
 
-    # Paginate (only if limit is specified)
-    if limit:
-        p = page or 1
-        tickets = query.offset((p - 1) * limit).limit(limit).all()
+    # One extra row tells whether another page exists without counting
+    if not include_total:
+        rows = build_page_query(db, lookahead=1).all()
+        total = None
+    elif cursor:
+        rows = build_page_query(db, lookahead=1).all()
+        total = count_filtered()
     else:
-        tickets = query.all()
-
-    # Build response with SLA remaining calculation
-    ticket_items = []
-    for t in tickets:
-        sla_remaining = calculate_sla_remaining_sec(
-            t.first_inbound_at, t.first_response_sec, settings.sla_threshold_minutes
-        )
-        ticket_items.append(
-            TicketItem(
-                ticket_id=t.ticket_id,
-                clinic_key=t.clinic_key,
-                status=t.status,
-                priority=t.priority,
-                topic_primary=t.topic_primary,
-                summary_latest=t.summary_latest,
-                intent=t.intent,
-                first_inbound_at=t.first_inbound_at,
-                last_inbound_at=t.last_inbound_at,
-                last_outbound_at=t.last_outbound_at,
-                last_message_sender=t.last_message_sender,
-                needs_reply=t.needs_reply if t.needs_reply is not None else True,
-                sla_breached=t.sla_breached,
-                sla_remaining_sec=sla_remaining,
-            )
-        )
+        rows = build_page_query(db, with_total=True, lookahead=1).all()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end: no rows to carry the window count
+            total = count_filtered()
+        else:
+            total = 0
+
+    has_more = bool(limit) and len(rows) > limit
+    if has_more:
+        rows = rows[:limit]
+    next_cursor = _encode_ticket_cursor(rows[-1]) if has_more else None
 
-    return TicketListResponse(
-        ok=True, tickets=ticket_items, total=total, page=page or 1
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "tickets": _rows_to_dicts(rows, TICKET_ITEM_FIELDS),
+            "total": total,
+            "page": page or 1,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
     )
 
 
 @app.get("/v1/tickets/{ticket_id}", response_model=TicketResponse)
-async def get_ticket(
+def get_ticket(
     ticket_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get single ticket detail"""
-    ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
+    # TicketDetail is column-only; any relationship access would raise instead
+    # of silently issuing a lazy SELECT
+    ticket = (
+        db.query(Ticket)
+        .options(raiseload("*"))
+        .filter(Ticket.ticket_id == ticket_id)
+        .first()
+    )
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -518,14 +742,19 @@ async def get_ticket(
 
 
 @app.patch("/v1/tickets/{ticket_id}", response_model=TicketResponse)
-async def update_ticket(
+def update_ticket(
     ticket_id: UUID,
     update: TicketUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update ticket"""
-    ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
+    ticket = (
+        db.query(Ticket)
+        .options(raiseload("*"))
+        .filter(Ticket.ticket_id == ticket_id)
+        .first()
+    )
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -536,28 +765,28 @@ async def update_ticket(
         )
 
     if update.status is not None:
-        if update.status not in TICKET_STATUSES:
+        if update.status not in TICKET_STATUS_SET:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "ok": False,
                     "error": {
                         "code": "VALIDATION_ERROR",
-                        "message": f"Invalid status. Must be one of: {', '.join(TICKET_STATUSES)}",
+                        "message": f"Invalid status. Must be one of: {TICKET_STATUSES_DISPLAY}",
                     },
                 },
             )
         ticket.status = update.status
 
     if update.priority is not None:
-        if update.priority not in TICKET_PRIORITIES:
+        if update.priority not in TICKET_PRIORITY_SET:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "ok": False,
                     "error": {
                         "code": "VALIDATION_ERROR",
-                        "message": f"Invalid priority. Must be one of: {', '.join(TICKET_PRIORITIES)}",
+                        "message": f"Invalid priority. Must be one of: {TICKET_PRIORITIES_DISPLAY}",
                     },
                 },
             )
@@ -574,19 +803,52 @@ async def update_ticket(
 
     db.commit()
     db.refresh(ticket)
+    invalidate_dashboard_aggregates()
 
     return TicketResponse(ok=True, ticket=TicketDetail.model_validate(ticket))
 
 
 @app.delete("/v1/tickets/{ticket_id}")
-async def delete_ticket(
+def delete_ticket(
     ticket_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Delete ticket and related data"""
-    ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
-    if not ticket:
+    """Delete ticket and related data
+
+    Event links, SLA alerts, feedback and staff response rows go with the
+    ticket through their ON DELETE CASCADE foreign keys (on SQLite, which
+    doesn't enforce them by default, they are deleted explicitly). LLM
+    annotations reference tickets polymorphically (no FK), so they are removed
+    explicitly in the same transaction (as a CTE of the ticket DELETE on Postgres).
+    """
+    delete_annotations = delete(LLMAnnotation).where(
+        LLMAnnotation.target_type == "ticket", LLMAnnotation.target_id == ticket_id
+    )
+    delete_ticket_stmt = (
+        delete(Ticket)
+        .where(Ticket.ticket_id == ticket_id)
+        .execution_options(synchronize_session=False)
+    )
+
+    if db.bind.dialect.name == "sqlite":
+        # SQLite has no data-modifying CTEs and leaves foreign keys unenforced
+        db.execute(delete_annotations.execution_options(synchronize_session=False))
+        for model in (TicketEventLink, SLAAlertLog, ClassificationFeedback, StaffResponseLog):
+            db.execute(
+                delete(model)
+                .where(model.ticket_id == ticket_id)
+                .execution_options(synchronize_session=False)
+            )
+    else:
+        # One round trip: WITH deleted_annotations AS (DELETE ...) DELETE FROM ticket ...
+        delete_ticket_stmt = delete_ticket_stmt.add_cte(
+            delete_annotations.cte("deleted_annotations")
+        )
+    deleted = db.execute(delete_ticket_stmt).rowcount
+
+    if not deleted:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -594,61 +856,76 @@ async def delete_ticket(
                 "error": {"code": "NOT_FOUND", "message": "Ticket not found"},
             },
         )
-
-    # Delete related ticket_event_links
-    db.query(TicketEventLink).filter(TicketEventLink.ticket_id == ticket_id).delete()
-
-    # Delete related llm_annotations (target_type='ticket' and target_id=ticket_id)
-    db.query(LLMAnnotation).filter(
-        LLMAnnotation.target_type == "ticket", LLMAnnotation.target_id == ticket_id
-    ).delete()
-
-    # Delete ticket
-    db.delete(ticket)
     db.commit()
+    invalidate_dashboard_aggregates()
+    # The ticket's feedback rows went with it (ON DELETE CASCADE)
+    feedback_stats_cache.clear()
 
     return {"ok": True, "deleted_ticket_id": str(ticket_id)}
 
 
 @app.get("/v1/tickets/{ticket_id}/events", response_model=TicketEventResponse)
-async def get_ticket_events(
+def get_ticket_events(
     ticket_id: UUID,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get events (messages) linked to a ticket"""
-    ticket = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).first()
-    if not ticket:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "ok": False,
-                "error": {"code": "NOT_FOUND", "message": "Ticket not found"},
-            },
-        )
+    """Get events (messages) linked to a ticket
 
-    # Get linked events
-    events = (
-        db.query(MessageEvent)
-        .join(TicketEventLink, TicketEventLink.event_id == MessageEvent.event_id)
-        .filter(TicketEventLink.ticket_id == ticket_id)
-        .order_by(MessageEvent.received_at.asc())
-        .all()
+    Send `Accept: application/x-ndjson` to stream one event per line.
+    """
+
+    def ticket_exists() -> bool:
+        return db.query(
+            db.query(Ticket).filter(Ticket.ticket_id == ticket_id).exists()
+        ).scalar()
+
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "ok": False,
+            "error": {"code": "NOT_FOUND", "message": "Ticket not found"},
+        },
     )
 
-    return TicketEventResponse(
-        ok=True,
-        events=[
-            TicketEventItem(
-                event_id=e.event_id,
-                sender_name=e.sender_name,
-                sender_type=e.sender_type,
-                staff_member=e.staff_member,
-                text_raw=e.text_raw,
-                received_at=e.received_at,
+    def build_query(session: Session):
+        return (
+            session.query(MessageEvent)
+            # Load just the TicketEventItem columns; any relationship access would raise
+            # instead of silently issuing a lazy SELECT per event
+            .options(
+                load_only(
+                    MessageEvent.event_id,
+                    MessageEvent.sender_name,
+                    MessageEvent.sender_type,
+                    MessageEvent.staff_member,
+                    MessageEvent.text_raw,
+                    MessageEvent.received_at,
+                ),
+                raiseload("*"),
             )
-            for e in events
-        ],
+            .join(TicketEventLink, TicketEventLink.event_id == MessageEvent.event_id)
+            .filter(TicketEventLink.ticket_id == ticket_id)
+            .order_by(MessageEvent.received_at.asc())
+        )
+
+    if _wants_ndjson(request):
+        # A streamed body cannot turn into a 404 later, so check up front
+        if not ticket_exists():
+            raise not_found
+        return StreamingResponse(
+            _ndjson_stream(build_query, TICKET_EVENT_ITEM_FIELDS), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    events = build_query(db).all()
+
+    # No linked events: only then check whether the ticket exists at all
+    if not events and not ticket_exists():
+        raise not_found
+
+    return ORJSONResponse(
+        {"ok": True, "events": _rows_to_dicts(events, TICKET_EVENT_ITEM_FIELDS)}
     )
 
 
@@ -658,113 +935,132 @@ async def get_ticket_events(
 
 
 @app.get("/v1/metrics/overview", response_model=MetricsResponse)
-async def get_metrics(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+def get_metrics(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
-    """Get dashboard overview metrics"""
-    now = get_kst_now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    """Get dashboard overview metrics (global; cached briefly per process)"""
+    today_start = get_kst_today_start()
 
-    # Today's inbound messages
-    today_inbound = (
-        db.query(func.count(MessageEvent.event_id))
-        .filter(
-            MessageEvent.direction == "inbound", MessageEvent.received_at >= today_start
+    def compute() -> ORJSONResponse:
+        # Today's inbound messages, as a scalar subquery on the ticket aggregate
+        today_inbound = (
+            db.query(func.count())
+            .select_from(MessageEvent)
+            .filter(
+                MessageEvent.direction == "inbound",
+                MessageEvent.received_at >= today_start,
+            )
+            .scalar_subquery()
         )
-        .scalar()
-        or 0
-    )
 
-    # SLA breached tickets
-    sla_breached_count = (
-        db.query(func.count(Ticket.ticket_id))
-        .filter(Ticket.sla_breached == True)
-        .scalar()
-        or 0
-    )
-
-    # Urgent tickets (priority = urgent, all lifecycle stages are "open")
-    urgent_count = (
-        db.query(func.count(Ticket.ticket_id))
-        .filter(Ticket.priority == "urgent")
-        .scalar()
-        or 0
-    )
-
-    # Open tickets (all tickets in any lifecycle stage)
-    open_tickets = db.query(func.count(Ticket.ticket_id)).scalar() or 0
+        # Everything in one round trip (conditional aggregates): today's inbound,
+        # SLA breached, urgent (all lifecycle stages are "open"), open tickets,
+        # and average response time for tickets with responses
+        ticket_stats = (
+            db.query(
+                today_inbound.label("today_inbound"),
+                func.count().filter(Ticket.sla_breached.is_(True)).label("sla_breached"),
+                func.count().filter(Ticket.priority == "urgent").label("urgent"),
+                func.count().label("open"),
+                func.avg(Ticket.first_response_sec).label("avg_response"),
+            )
+            .select_from(Ticket)
+            .one()
+        )
+        avg_response = ticket_stats.avg_response
 
-    # Average response time (for tickets with responses)
-    avg_response = (
-        db.query(func.avg(Ticket.first_response_sec))
-        .filter(Ticket.first_response_sec.isnot(None))
-        .scalar()
-    )
+        # Response is built once and cached pre-rendered; MetricsResponse stays
+        # on the route for the OpenAPI schema only
+        return _with_etag(
+            ORJSONResponse(
+                {
+                    "ok": True,
+                    "metrics": {
+                        "today_inbound": ticket_stats.today_inbound or 0,
+                        "sla_breached_count": ticket_stats.sla_breached or 0,
+                        "urgent_count": ticket_stats.urgent or 0,
+                        "open_tickets": ticket_stats.open or 0,
+                        "avg_response_sec": int(avg_response) if avg_response else None,
+                    },
+                }
+            )
+        )
 
-    return MetricsResponse(
-        ok=True,
-        metrics=MetricsData(
-            today_inbound=today_inbound,
-            sla_breached_count=sla_breached_count,
-            urgent_count=urgent_count,
-            open_tickets=open_tickets,
-            avg_response_sec=int(avg_response) if avg_response else None,
-        ),
-    )
+    # Keyed by KST date so "today" counts never carry over past midnight
+    response = metrics_cache.get_or_set(("overview", today_start.date()), compute)
+    return _not_modified_or(request, response)
 
 
 @app.get("/v1/clinics/health", response_model=ClinicHealthResponse)
-async def get_clinics_health(
-    db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
+def get_clinics_health(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
-    """Get health status per clinic"""
-    now = get_kst_now()
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-    # Get all unique clinics with tickets (all lifecycle stages are "open")
-    clinics_query = (
-        db.query(
-            Ticket.clinic_key,
-            func.count(Ticket.ticket_id).label("open_tickets"),
-            func.count(Ticket.ticket_id)
-            .filter(Ticket.sla_breached == True)
-            .label("sla_breached"),
-            func.count(Ticket.ticket_id)
-            .filter(Ticket.priority == "urgent")
-            .label("urgent_count"),
+    """Get health status per clinic (global; cached briefly per process)"""
+    today_start = get_kst_today_start()
+
+    def compute() -> ORJSONResponse:
+        # Per-clinic ticket aggregates (all lifecycle stages are "open") and today's
+        # inbound per chat room (chat_room == clinic_key), joined in one round trip
+        ticket_stats = (
+            db.query(
+                Ticket.clinic_key.label("clinic_key"),
+                func.count().label("open_tickets"),
+                func.count().filter(Ticket.sla_breached.is_(True)).label("sla_breached"),
+                func.count().filter(Ticket.priority == "urgent").label("urgent_count"),
+            )
+            .group_by(Ticket.clinic_key)
+            .subquery()
         )
-        .group_by(Ticket.clinic_key)
-        .all()
-    )
-
-    clinics = []
-    for row in clinics_query:
-        # Count today's inbound for this clinic
-        today_inbound = (
-            db.query(func.count(MessageEvent.event_id))
+        inbound_stats = (
+            db.query(
+                MessageEvent.chat_room.label("chat_room"),
+                func.count().label("today_inbound"),
+            )
             .filter(
-                MessageEvent.chat_room == row.clinic_key,
                 MessageEvent.direction == "inbound",
                 MessageEvent.received_at >= today_start,
             )
-            .scalar()
-            or 0
+            .group_by(MessageEvent.chat_room)
+            .subquery()
         )
-
-        clinics.append(
-            ClinicHealth(
-                clinic_key=row.clinic_key,
-                today_inbound=today_inbound,
-                sla_breached=row.sla_breached or 0,
-                urgent_count=row.urgent_count or 0,
-                open_tickets=row.open_tickets or 0,
+        # Most SLA breaches first, then most urgent
+        clinics_query = (
+            db.query(
+                ticket_stats.c.clinic_key,
+                ticket_stats.c.open_tickets,
+                ticket_stats.c.sla_breached,
+                ticket_stats.c.urgent_count,
+                func.coalesce(inbound_stats.c.today_inbound, 0).label("today_inbound"),
+            )
+            .outerjoin(
+                inbound_stats, inbound_stats.c.chat_room == ticket_stats.c.clinic_key
+            )
+            .order_by(
+                ticket_stats.c.sla_breached.desc(),
+                ticket_stats.c.urgent_count.desc(),
+                ticket_stats.c.clinic_key,
             )
+            .all()
         )
 
-    # Sort by SLA breached count desc
-    clinics.sort(key=lambda x: (x.sla_breached, x.urgent_count), reverse=True)
+        clinics = [
+            {
+                "clinic_key": row.clinic_key,
+                "today_inbound": row.today_inbound,
+                "sla_breached": row.sla_breached or 0,
+                "urgent_count": row.urgent_count or 0,
+                "open_tickets": row.open_tickets or 0,
+            }
+            for row in clinics_query
+        ]
+        return _with_etag(ORJSONResponse({"ok": True, "clinics": clinics}))
 
-    return ClinicHealthResponse(ok=True, clinics=clinics)
+    response = clinics_health_cache.get_or_set(("clinics", today_start.date()), compute)
+    return _not_modified_or(request, response)
 
 
 # ============================================
@@ -773,7 +1069,7 @@ async def get_clinics_health(
 
 
 @app.get("/v1/metrics/resolution")
-async def get_resolution_stats(
+def get_resolution_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -828,7 +1124,7 @@ async def get_resolution_stats(
 
 
 @app.get("/v1/clinics/profiles")
-async def get_clinic_profiles(
+def get_clinic_profiles(
     label: Optional[str] = Query(None, description="Filter by profile_label"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -840,29 +1136,31 @@ async def get_clinic_profiles(
 
     profiles = query.order_by(ClinicProfile.updated_at.desc()).all()
 
-    return {
-        "ok": True,
-        "profiles": [
-            {
-                "clinic_key": p.clinic_key,
-                "sentiment_avg": float(p.sentiment_avg) if p.sentiment_avg else None,
-                "complaint_ratio": float(p.complaint_ratio) if p.complaint_ratio else None,
-                "urgency_avg": float(p.urgency_avg) if p.urgency_avg else None,
-                "escalation_tendency": float(p.escalation_tendency) if p.escalation_tendency else None,
-                "recontact_rate": float(p.recontact_rate) if p.recontact_rate else None,
-                "profile_label": p.profile_label,
-                "total_interactions": p.total_interactions,
-                "total_tickets": p.total_tickets,
-                "last_analyzed_at": p.last_analyzed_at.isoformat() if p.last_analyzed_at else None,
-            }
-            for p in profiles
-        ],
-        "total": len(profiles),
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "profiles": [
+                {
+                    "clinic_key": p.clinic_key,
+                    "sentiment_avg": float(p.sentiment_avg) if p.sentiment_avg else None,
+                    "complaint_ratio": float(p.complaint_ratio) if p.complaint_ratio else None,
+                    "urgency_avg": float(p.urgency_avg) if p.urgency_avg else None,
+                    "escalation_tendency": float(p.escalation_tendency) if p.escalation_tendency else None,
+                    "recontact_rate": float(p.recontact_rate) if p.recontact_rate else None,
+                    "profile_label": p.profile_label,
+                    "total_interactions": p.total_interactions,
+                    "total_tickets": p.total_tickets,
+                    "last_analyzed_at": p.last_analyzed_at,
+                }
+                for p in profiles
+            ],
+            "total": len(profiles),
+        }
+    )
 
 
 @app.get("/v1/clinics/{clinic_key}/profile")
-async def get_clinic_profile(
+def get_clinic_profile(
     clinic_key: str,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -873,25 +1171,27 @@ async def get_clinic_profile(
     if not profile:
         return {"ok": True, "profile": None, "message": "No profile data yet"}
 
-    return {
-        "ok": True,
-        "profile": {
-            "clinic_key": profile.clinic_key,
-            "sentiment_avg": float(profile.sentiment_avg) if profile.sentiment_avg else None,
-            "complaint_ratio": float(profile.complaint_ratio) if profile.complaint_ratio else None,
-            "urgency_avg": float(profile.urgency_avg) if profile.urgency_avg else None,
-            "escalation_tendency": float(profile.escalation_tendency) if profile.escalation_tendency else None,
-            "recontact_rate": float(profile.recontact_rate) if profile.recontact_rate else None,
-            "profile_label": profile.profile_label,
-            "total_interactions": profile.total_interactions,
-            "total_tickets": profile.total_tickets,
-            "last_analyzed_at": profile.last_analyzed_at.isoformat() if profile.last_analyzed_at else None,
-        },
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "profile": {
+                "clinic_key": profile.clinic_key,
+                "sentiment_avg": float(profile.sentiment_avg) if profile.sentiment_avg else None,
+                "complaint_ratio": float(profile.complaint_ratio) if profile.complaint_ratio else None,
+                "urgency_avg": float(profile.urgency_avg) if profile.urgency_avg else None,
+                "escalation_tendency": float(profile.escalation_tendency) if profile.escalation_tendency else None,
+                "recontact_rate": float(profile.recontact_rate) if profile.recontact_rate else None,
+                "profile_label": profile.profile_label,
+                "total_interactions": profile.total_interactions,
+                "total_tickets": profile.total_tickets,
+                "last_analyzed_at": profile.last_analyzed_at,
+            },
+        }
+    )
 
 
 @app.get("/v1/topics/knowledge")
-async def get_topic_knowledge(
+def get_topic_knowledge(
     topic: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -903,22 +1203,24 @@ async def get_topic_knowledge(
 
     entries = query.order_by(TopicKnowledge.occurrence_count.desc()).all()
 
-    return {
-        "ok": True,
-        "topics": [
-            {
-                "topic": e.topic,
-                "pattern_summary": e.pattern_summary,
-                "resolution_summary": e.resolution_summary,
-                "example_conversation": e.example_conversation,
-                "occurrence_count": e.occurrence_count,
-                "resolution_success_rate": float(e.resolution_success_rate) if e.resolution_success_rate else None,
-                "updated_at": e.updated_at.isoformat() if e.updated_at else None,
-            }
-            for e in entries
-        ],
-        "total": len(entries),
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "topics": [
+                {
+                    "topic": e.topic,
+                    "pattern_summary": e.pattern_summary,
+                    "resolution_summary": e.resolution_summary,
+                    "example_conversation": e.example_conversation,
+                    "occurrence_count": e.occurrence_count,
+                    "resolution_success_rate": float(e.resolution_success_rate) if e.resolution_success_rate else None,
+                    "updated_at": e.updated_at,
+                }
+                for e in entries
+            ],
+            "total": len(entries),
+        }
+    )
 
 
 # ============================================
@@ -927,7 +1229,7 @@ async def get_topic_knowledge(
 
 
 @app.get("/v1/learning/understanding")
-async def get_latest_understanding(
+def get_latest_understanding(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Get latest CS understanding"""
@@ -950,38 +1252,34 @@ async def get_latest_understanding(
         .all()
     )
 
-    return {
-        "ok": True,
-        "understanding": {
-            "version": understanding.version,
-            "created_at": understanding.created_at.isoformat()
-            if understanding.created_at
-            else None,
-            "logs_analyzed_count": understanding.logs_analyzed_count,
-            "logs_date_from": understanding.logs_date_from.isoformat()
-            if understanding.logs_date_from
-            else None,
-            "logs_date_to": understanding.logs_date_to.isoformat()
-            if understanding.logs_date_to
-            else None,
-            "understanding_text": understanding.understanding_text,
-            "key_insights": understanding.key_insights,
-            "model_used": understanding.model_used,
-            "prompt_tokens": understanding.prompt_tokens,
-            "completion_tokens": understanding.completion_tokens,
-        },
-        "previous_versions": [
-            {
-                "version": v.version,
-                "created_at": v.created_at.isoformat() if v.created_at else None,
-            }
-            for v in previous_versions
-        ],
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "understanding": {
+                "version": understanding.version,
+                "created_at": understanding.created_at,
+                "logs_analyzed_count": understanding.logs_analyzed_count,
+                "logs_date_from": understanding.logs_date_from,
+                "logs_date_to": understanding.logs_date_to,
+                "understanding_text": understanding.understanding_text,
+                "key_insights": understanding.key_insights,
+                "model_used": understanding.model_used,
+                "prompt_tokens": understanding.prompt_tokens,
+                "completion_tokens": understanding.completion_tokens,
+            },
+            "previous_versions": [
+                {
+                    "version": v.version,
+                    "created_at": v.created_at,
+                }
+                for v in previous_versions
+            ],
+        }
+    )
 
 
 @app.get("/v1/learning/understanding/{version}")
-async def get_understanding_by_version(
+def get_understanding_by_version(
     version: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1003,81 +1301,92 @@ async def get_understanding_by_version(
             },
         )
 
-    return {
-        "ok": True,
-        "understanding": {
-            "version": understanding.version,
-            "created_at": understanding.created_at.isoformat()
-            if understanding.created_at
-            else None,
-            "logs_analyzed_count": understanding.logs_analyzed_count,
-            "logs_date_from": understanding.logs_date_from.isoformat()
-            if understanding.logs_date_from
-            else None,
-            "logs_date_to": understanding.logs_date_to.isoformat()
-            if understanding.logs_date_to
-            else None,
-            "understanding_text": understanding.understanding_text,
-            "key_insights": understanding.key_insights,
-            "model_used": understanding.model_used,
-            "prompt_tokens": understanding.prompt_tokens,
-            "completion_tokens": understanding.completion_tokens,
-        },
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "understanding": {
+                "version": understanding.version,
+                "created_at": understanding.created_at,
+                "logs_analyzed_count": understanding.logs_analyzed_count,
+                "logs_date_from": understanding.logs_date_from,
+                "logs_date_to": understanding.logs_date_to,
+                "understanding_text": understanding.understanding_text,
+                "key_insights": understanding.key_insights,
+                "model_used": understanding.model_used,
+                "prompt_tokens": understanding.prompt_tokens,
+                "completion_tokens": understanding.completion_tokens,
+            },
+        }
+    )
 
 
-@app.post("/v1/learning/run")
-async def trigger_learning_cycle(
-    db: Session = Depends(get_db), current_user: User = Depends(get_admin_user)
-):
-    """Trigger manual learning cycle by calling Worker service"""
+# Fail fast when the worker is unreachable; the cycle itself runs in the worker
+WORKER_TRIGGER_TIMEOUT = httpx.Timeout(30.0, connect=1.0)
 
-    # Worker service URL (Cloud Run internal or localhost for dev)
-    worker_url = os.environ.get("WORKER_URL", "http://localhost:8080")
+# The in-flight manual learning trigger (worker call or local fallback run), owned by
+# the app rather than tied to the response so a dropped request can't strand it
+_learning_trigger_task: asyncio.Task | None = None
+
+
+def _run_learning_locally():
+    from worker.learning import run_learning_cycle_manual
 
     try:
-        worker_secret = os.environ.get("WORKER_SECRET", "")
-        headers = {"X-Worker-Secret": worker_secret} if worker_secret else {}
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(f"{worker_url}/learning/run", headers=headers)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {
-                    "ok": False,
-                    "status": "error",
-                    "message": f"Worker returned status {response.status_code}",
-                }
-    except httpx.RequestError as e:
-        # Fallback: try to run locally if worker is not accessible
-        logger.warning(f"Worker not accessible ({e}), trying local execution...")
-        try:
-            from worker.learning import run_learning_cycle_manual
+        run_learning_cycle_manual()
+    except Exception as ex:
+        logger.error(f"Local learning run failed: {ex}")
 
-            def run_in_background():
-                try:
-                    run_learning_cycle_manual()
-                except Exception as ex:
-                    logger.error(f"Local learning run failed: {ex}")
 
-            thread = threading.Thread(target=run_in_background, daemon=True)
-            thread.start()
+async def _call_worker_learning(client: httpx.AsyncClient, worker_url: str, headers: dict):
+    """Ask the worker to start a learning cycle, falling back to a local run"""
+    try:
+        response = await client.post(
+            f"{worker_url}/learning/run", headers=headers, timeout=WORKER_TRIGGER_TIMEOUT
+        )
+        if response.status_code != 200:
+            logger.warning(f"Worker returned status {response.status_code} for learning run")
+    except httpx.RequestError as e:
+        # Fallback: run locally if worker is not accessible (in the threadpool,
+        # still inside this background task so the trigger lock covers it)
+        logger.warning(f"Worker not accessible ({e}), running learning cycle locally...")
+        await run_in_threadpool(_run_learning_locally)
 
-            return {
+
+@app.post("/v1/learning/run", status_code=status.HTTP_202_ACCEPTED)
+async def trigger_learning_cycle(
+    request: Request,
+    current_user: User = Depends(get_admin_user),
+):
+    """Queue a manual learning cycle on the Worker service and return immediately"""
+    global _learning_trigger_task
+    if _learning_trigger_task is not None and not _learning_trigger_task.done():
+        return ORJSONResponse(
+            {
                 "ok": True,
-                "status": "started",
-                "message": "Learning cycle started locally (worker not accessible)",
-            }
-        except Exception as local_err:
-            return {
-                "ok": False,
-                "status": "error",
-                "message": f"Failed to trigger learning: {str(local_err)}",
-            }
+                "status": "already_running",
+                "message": "A learning cycle trigger is already in progress",
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+    # Worker service URL (Cloud Run internal or localhost for dev)
+    worker_url = os.environ.get("WORKER_URL", "http://localhost:8080")
+    worker_secret = os.environ.get("WORKER_SECRET", "")
+    headers = {"X-Worker-Secret": worker_secret} if worker_secret else {}
+
+    _learning_trigger_task = asyncio.create_task(
+        _call_worker_learning(request.app.state.http, worker_url, headers)
+    )
+
+    return {
+        "ok": True,
+        "status": "queued",
+        "message": "Learning cycle queued",
+    }
 
 
 @app.get("/v1/learning/history")
-async def get_learning_history(
+def get_learning_history(
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1090,21 +1399,23 @@ async def get_learning_history(
         .all()
     )
 
-    return {
-        "ok": True,
-        "executions": [
-            {
-                "id": str(e.id),
-                "executed_at": e.executed_at.isoformat() if e.executed_at else None,
-                "status": e.status,
-                "trigger_type": e.trigger_type,
-                "duration_seconds": e.duration_seconds,
-                "understanding_version": e.understanding_version,
-                "error_message": e.error_message,
-            }
-            for e in executions
-        ],
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "executions": [
+                {
+                    "id": str(e.id),
+                    "executed_at": e.executed_at,
+                    "status": e.status,
+                    "trigger_type": e.trigger_type,
+                    "duration_seconds": e.duration_seconds,
+                    "understanding_version": e.understanding_version,
+                    "error_message": e.error_message,
+                }
+                for e in executions
+            ],
+        }
+    )
 
 
 # ============================================
@@ -1112,54 +1423,60 @@ async def get_learning_history(
 # ============================================
 
 
+# Polled by every open dashboard, so the statement is built (and its cache key
+# computed) once; each poll only binds user_id and limit.
+# Notifications for the user OR global ones (user_id is NULL). The unread count
+# is a window aggregate over the same filter (evaluated before LIMIT), so list +
+# count share one round trip.
+_LIST_NOTIFICATIONS_STMT = (
+    select(
+        *(getattr(Notification, field) for field in NOTIFICATION_ITEM_FIELDS),
+        func.sum(case((Notification.is_read.is_(False), 1), else_=0))
+        .over()
+        .label("unread_count"),
+    )
+    .where(
+        or_(
+            Notification.user_id == bindparam("user_id"),
+            Notification.user_id.is_(None),
+        )
+    )
+    .order_by(Notification.created_at.desc())
+    .limit(bindparam("limit"))
+)
+
+
 @app.get("/v1/notifications", response_model=NotificationListResponse)
-async def list_notifications(
+def list_notifications(
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get notifications for current user"""
-    # Get notifications for current user OR global notifications (user_id is None)
-    notifications = (
-        db.query(Notification)
-        .filter(
-            or_(Notification.user_id == current_user.id, Notification.user_id.is_(None))
-        )
-        .order_by(Notification.created_at.desc())
-        .limit(limit)
-        .all()
-    )
-
-    # Count unread
-    unread_count = (
-        db.query(func.count(Notification.id))
-        .filter(
-            or_(
-                Notification.user_id == current_user.id, Notification.user_id.is_(None)
-            ),
-            Notification.is_read == False,
-        )
-        .scalar()
-        or 0
-    )
+    notifications = db.execute(
+        _LIST_NOTIFICATIONS_STMT, {"user_id": current_user.id, "limit": limit}
+    ).all()
+    unread_count = int(notifications[0].unread_count or 0) if notifications else 0
 
-    return NotificationListResponse(
-        ok=True,
-        notifications=[NotificationItem.model_validate(n) for n in notifications],
-        unread_count=unread_count,
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "notifications": _rows_to_dicts(notifications, NOTIFICATION_ITEM_FIELDS),
+            "unread_count": unread_count,
+        }
     )
 
 
 @app.post(
     "/v1/notifications/{notification_id}/read", response_model=NotificationReadResponse
 )
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Mark a notification as read"""
-    notification = (
+    """Mark a notification as read (idempotent; single UPDATE)"""
+    updated = (
         db.query(Notification)
         .filter(
             Notification.id == notification_id,
@@ -1167,10 +1484,12 @@ async def mark_notification_read(
                 Notification.user_id == current_user.id, Notification.user_id.is_(None)
             ),
         )
-        .first()
+        .update({Notification.is_read: True}, synchronize_session=False)
     )
 
-    if not notification:
+    # Matched-row count: already-read notifications still count, missing ones are 404
+    if not updated:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -1179,14 +1498,13 @@ async def mark_notification_read(
             },
         )
 
-    notification.is_read = True
     db.commit()
 
     return NotificationReadResponse(ok=True, message="Notification marked as read")
 
 
 @app.post("/v1/notifications/read-all", response_model=NotificationReadAllResponse)
-async def mark_all_notifications_read(
+def mark_all_notifications_read(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Mark all notifications as read for current user"""
@@ -1198,7 +1516,9 @@ async def mark_all_notifications_read(
             ),
             Notification.is_read == False,
         )
-        .update({"is_read": True})
+        # No notifications are loaded in this session, so skip the
+        # evaluate/fetch step that keeps identity-map objects in sync
+        .update({Notification.is_read: True}, synchronize_session=False)
     )
 
     db.commit()
@@ -1213,40 +1533,112 @@ async def mark_all_notifications_read(
 # ============================================
 
 
+def _encode_template_cursor(row) -> str:
+    """Opaque keyset cursor for the template list sort key of `row`"""
+    key = [row.usage_count, row.updated_at.isoformat(), row.id]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).decode("ascii")
+
+
+def _template_cursor_filter(cursor: str):
+    """WHERE clause selecting the rows after `cursor` in list_templates order"""
+    try:
+        usage_count, updated_at, template_id = orjson.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        usage_count = int(usage_count)
+        updated_at = datetime.fromisoformat(updated_at)
+        template_id = int(template_id)
+    except (ValueError, TypeError, orjson.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "ok": False,
+                "error": {"code": "VALIDATION_ERROR", "message": "Invalid cursor"},
+            },
+        ) from None
+
+    # Every sort column is DESC, so "after the cursor" is a row-value less-than
+    return tuple_(
+        MessageTemplate.usage_count, MessageTemplate.updated_at, MessageTemplate.id
+    ) < tuple_(usage_count, updated_at, template_id)
+
+
 @app.get("/v1/templates", response_model=TemplateListResponse)
-async def list_templates(
+def list_templates(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search in title and content"),
+    limit: int | None = Query(
+        None, ge=1, le=1000, description="Page size (omit to return every match)"
+    ),
+    cursor: str | None = Query(None, description="next_cursor from the previous page (keyset pagination)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all templates with optional filtering"""
-    query = db.query(MessageTemplate)
+    """List templates with optional filtering (most used first).
 
+    Without `limit` every matching template is returned (has_more is false);
+    with it, pages continue from `next_cursor`.
+    Send `Accept: application/x-ndjson` to stream one template per line.
+    """
+    filters = []
     if category:
-        query = query.filter(MessageTemplate.category == category)
+        filters.append(MessageTemplate.category == category)
 
     if search:
+        # Served by the pg_trgm GIN indexes from migrations/006 (not in the model or
+        # startup migrations); without them this is a sequential scan
         search_pattern = f"%{search}%"
-        query = query.filter(
+        filters.append(
             or_(
                 MessageTemplate.title.ilike(search_pattern),
                 MessageTemplate.content.ilike(search_pattern),
             )
         )
 
-    # Order by usage count (most used first), then by updated_at
-    templates = query.order_by(
-        MessageTemplate.usage_count.desc(), MessageTemplate.updated_at.desc()
-    ).all()
+    if cursor:
+        filters.append(_template_cursor_filter(cursor))
+
+    def build_query(session: Session, lookahead: int = 0):
+        # Order by usage count (most used first), then by updated_at; id keeps it stable
+        # (matches ix_template_list_order so the page can be read from the index)
+        query = (
+            session.query(
+                *(getattr(MessageTemplate, f) for f in TEMPLATE_ITEM_FIELDS),
+                MessageTemplate.updated_at,
+            )
+            .filter(*filters)
+            .order_by(
+                MessageTemplate.usage_count.desc(),
+                MessageTemplate.updated_at.desc(),
+                MessageTemplate.id.desc(),
+            )
+        )
+        return query if limit is None else query.limit(limit + lookahead)
+
+    if _wants_ndjson(request):
+        return StreamingResponse(
+            _ndjson_stream(build_query, TEMPLATE_ITEM_FIELDS), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    # One extra row tells whether another page exists
+    templates = build_query(db, lookahead=1).all()
+    has_more = limit is not None and len(templates) > limit
+    if has_more:
+        templates = templates[:limit]
 
-    return TemplateListResponse(
-        ok=True, templates=[TemplateItem.model_validate(t) for t in templates]
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "templates": _rows_to_dicts(templates, TEMPLATE_ITEM_FIELDS),
+            "has_more": has_more,
+            "next_cursor": _encode_template_cursor(templates[-1]) if has_more else None,
+        }
     )
 
 
 @app.get("/v1/templates/categories")
-async def list_template_categories(
+def list_template_categories(
     db: Session = Depends(get_db), current_user: User = Depends(get_current_user)
 ):
     """Get list of template categories with counts"""
@@ -1265,14 +1657,17 @@ async def list_template_categories(
 
 
 @app.get("/v1/templates/{template_id}", response_model=TemplateResponse)
-async def get_template(
+def get_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get single template"""
     template = (
-        db.query(MessageTemplate).filter(MessageTemplate.id == template_id).first()
+        db.query(MessageTemplate)
+        .options(raiseload("*"))
+        .filter(MessageTemplate.id == template_id)
+        .first()
     )
     if not template:
         raise HTTPException(
@@ -1287,21 +1682,21 @@ async def get_template(
 
 
 @app.post("/v1/templates", response_model=TemplateResponse)
-async def create_template(
+def create_template(
     request: TemplateCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Create new template"""
     # Validate category
-    if request.category not in TEMPLATE_CATEGORIES:
+    if request.category not in TEMPLATE_CATEGORY_SET:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
                 "ok": False,
                 "error": {
                     "code": "VALIDATION_ERROR",
-                    "message": f"Invalid category. Must be one of: {', '.join(TEMPLATE_CATEGORIES)}",
+                    "message": f"Invalid category. Must be one of: {TEMPLATE_CATEGORIES_DISPLAY}",
                 },
             },
         )
@@ -1320,7 +1715,7 @@ async def create_template(
 
 
 @app.put("/v1/templates/{template_id}", response_model=TemplateResponse)
-async def update_template(
+def update_template(
     template_id: int,
     request: TemplateUpdate,
     db: Session = Depends(get_db),
@@ -1328,7 +1723,10 @@ async def update_template(
 ):
     """Update template"""
     template = (
-        db.query(MessageTemplate).filter(MessageTemplate.id == template_id).first()
+        db.query(MessageTemplate)
+        .options(raiseload("*"))
+        .filter(MessageTemplate.id == template_id)
+        .first()
     )
     if not template:
         raise HTTPException(
@@ -1346,14 +1744,14 @@ async def update_template(
         template.content = request.content
 
     if request.category is not None:
-        if request.category not in TEMPLATE_CATEGORIES:
+        if request.category not in TEMPLATE_CATEGORY_SET:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "ok": False,
                     "error": {
                         "code": "VALIDATION_ERROR",
-                        "message": f"Invalid category. Must be one of: {', '.join(TEMPLATE_CATEGORIES)}",
+                        "message": f"Invalid category. Must be one of: {TEMPLATE_CATEGORIES_DISPLAY}",
                     },
                 },
             )
@@ -1366,7 +1764,7 @@ async def update_template(
 
 
 @app.delete("/v1/templates/{template_id}", response_model=TemplateDeleteResponse)
-async def delete_template(
+def delete_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1393,16 +1791,24 @@ async def delete_template(
 
 
 @app.post("/v1/templates/{template_id}/copy", response_model=TemplateCopyResponse)
-async def copy_template(
+def copy_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Record template copy action (increment usage count)"""
-    template = (
-        db.query(MessageTemplate).filter(MessageTemplate.id == template_id).first()
+    # Increment in the database: no SELECT, and concurrent copies can't lose updates
+    # (usage_count is NOT NULL DEFAULT 0, so no COALESCE is needed)
+    updated = (
+        db.query(MessageTemplate)
+        .filter(MessageTemplate.id == template_id)
+        .update(
+            {MessageTemplate.usage_count: MessageTemplate.usage_count + 1},
+            synchronize_session=False,
+        )
     )
-    if not template:
+    if not updated:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
@@ -1411,7 +1817,6 @@ async def copy_template(
             },
         )
 
-    template.usage_count = (template.usage_count or 0) + 1
     db.commit()
 
     return TemplateCopyResponse(ok=True, message="Usage count updated")
@@ -1471,7 +1876,7 @@ def _check_correction_triggered_learning(db: Session):
 
 
 @app.post("/v1/feedback/classification", response_model=FeedbackResponse)
-async def submit_classification_feedback(
+def submit_classification_feedback(
     request: FeedbackCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -1543,6 +1948,7 @@ async def submit_classification_feedback(
     db.add(feedback)
     db.commit()
     db.refresh(feedback)
+    feedback_stats_cache.clear()
 
     # --- F2: Retroactive fix — update LLMAnnotation and Ticket with corrected values ---
     try:
@@ -1594,14 +2000,16 @@ async def submit_classification_feedback(
 
 
 @app.get("/v1/feedback/list", response_model=FeedbackListResponse)
-async def list_feedbacks(
+def list_feedbacks(
     limit: int = Query(50, ge=1, le=200),
     applied: Optional[bool] = Query(None, description="Filter by applied status"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List classification feedbacks"""
-    query = db.query(ClassificationFeedback)
+    query = db.query(
+        *(getattr(ClassificationFeedback, f) for f in FEEDBACK_ITEM_FIELDS)
+    )
 
     if applied is not None:
         if applied:
@@ -1609,79 +2017,92 @@ async def list_feedbacks(
         else:
             query = query.filter(ClassificationFeedback.applied_to_version.is_(None))
 
-    total = query.count()
-    feedbacks = (
-        query.order_by(ClassificationFeedback.corrected_at.desc()).limit(limit).all()
+    # The total comes from a window count (evaluated before LIMIT), so the
+    # page and count share one query
+    rows = (
+        query.add_columns(func.count().over().label("total"))
+        .order_by(ClassificationFeedback.corrected_at.desc())
+        .limit(limit)
+        .all()
     )
+    total = rows[0].total if rows else 0
 
-    return FeedbackListResponse(
-        ok=True,
-        feedbacks=[FeedbackItem.model_validate(f) for f in feedbacks],
-        total=total,
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "feedbacks": _rows_to_dicts(rows, FEEDBACK_ITEM_FIELDS),
+            "total": total,
+        }
     )
 
 
 @app.get("/v1/feedback/statistics", response_model=FeedbackStatsResponse)
-async def get_feedback_statistics(
+def get_feedback_statistics(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Get feedback statistics"""
-    total = db.query(func.count(ClassificationFeedback.id)).scalar() or 0
-    pending = (
-        db.query(func.count(ClassificationFeedback.id))
-        .filter(ClassificationFeedback.applied_to_version.is_(None))
-        .scalar()
-        or 0
-    )
-    applied = total - pending
-
-    by_type = (
-        db.query(
-            ClassificationFeedback.feedback_type,
-            func.count(ClassificationFeedback.id).label("count"),
-        )
-        .group_by(ClassificationFeedback.feedback_type)
-        .all()
-    )
-
-    top_corrections = (
-        db.query(
-            ClassificationFeedback.original_intent,
-            ClassificationFeedback.corrected_intent,
-            func.count(ClassificationFeedback.id).label("count"),
+    """Get feedback statistics (global; cached briefly per process)"""
+
+    def compute() -> ORJSONResponse:
+        # Per-type counts with their pending share in one pass; the overall
+        # total and pending are the sums over the types
+        by_type = (
+            db.query(
+                ClassificationFeedback.feedback_type,
+                func.count().label("count"),
+                func.count()
+                .filter(ClassificationFeedback.applied_to_version.is_(None))
+                .label("pending"),
+            )
+            .group_by(ClassificationFeedback.feedback_type)
+            .all()
         )
-        .filter(
-            ClassificationFeedback.corrected_intent.isnot(None),
-            ClassificationFeedback.original_intent
-            != ClassificationFeedback.corrected_intent,
+        total = sum(row.count for row in by_type)
+        pending = sum(row.pending for row in by_type)
+        applied = total - pending
+
+        top_corrections = (
+            db.query(
+                ClassificationFeedback.original_intent,
+                ClassificationFeedback.corrected_intent,
+                func.count(ClassificationFeedback.id).label("count"),
+            )
+            .filter(
+                ClassificationFeedback.corrected_intent.isnot(None),
+                ClassificationFeedback.original_intent
+                != ClassificationFeedback.corrected_intent,
+            )
+            .group_by(
+                ClassificationFeedback.original_intent,
+                ClassificationFeedback.corrected_intent,
+            )
+            .order_by(func.count(ClassificationFeedback.id).desc())
+            .limit(10)
+            .all()
         )
-        .group_by(
-            ClassificationFeedback.original_intent,
-            ClassificationFeedback.corrected_intent,
+
+        # Cached pre-rendered; FeedbackStatsResponse stays on the route for the schema
+        return ORJSONResponse(
+            {
+                "ok": True,
+                "statistics": {
+                    "total_feedback": total,
+                    "pending_application": pending,
+                    "applied": applied,
+                    "by_type": {row.feedback_type: row.count for row in by_type},
+                    "top_corrections": [
+                        {
+                            "from": row.original_intent,
+                            "to": row.corrected_intent,
+                            "count": row.count,
+                        }
+                        for row in top_corrections
+                    ],
+                },
+            }
         )
-        .order_by(func.count(ClassificationFeedback.id).desc())
-        .limit(10)
-        .all()
-    )
 
-    return FeedbackStatsResponse(
-        ok=True,
-        statistics={
-            "total_feedback": total,
-            "pending_application": pending,
-            "applied": applied,
-            "by_type": {row.feedback_type: row.count for row in by_type},
-            "top_corrections": [
-                {
-                    "from": row.original_intent,
-                    "to": row.corrected_intent,
-                    "count": row.count,
-                }
-                for row in top_corrections
-            ],
-        },
-    )
+    return feedback_stats_cache.get_or_set("statistics", compute)
 
 
 # ============================================
@@ -1690,43 +2111,43 @@ async def get_feedback_statistics(
 
 
 @app.get("/v1/patterns/pending", response_model=PatternListResponse)
-async def list_pending_patterns(
+def list_pending_patterns(
     limit: int = Query(200, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List patterns pending approval"""
     patterns = (
-        db.query(PatternApplicationLog)
+        db.query(*(getattr(PatternApplicationLog, f) for f in PATTERN_ITEM_FIELDS))
         .filter(PatternApplicationLog.status == "pending")
         .order_by(PatternApplicationLog.created_at.desc())
         .limit(limit)
         .all()
     )
-    return PatternListResponse(
-        ok=True, patterns=[PatternItem.model_validate(p) for p in patterns]
+    return ORJSONResponse(
+        {"ok": True, "patterns": _rows_to_dicts(patterns, PATTERN_ITEM_FIELDS)}
     )
 
 
 @app.get("/v1/patterns/all", response_model=PatternListResponse)
-async def list_all_patterns(
+def list_all_patterns(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(200, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List all patterns with optional status filter"""
-    query = db.query(PatternApplicationLog)
+    query = db.query(*(getattr(PatternApplicationLog, f) for f in PATTERN_ITEM_FIELDS))
     if status_filter:
         query = query.filter(PatternApplicationLog.status == status_filter)
     patterns = query.order_by(PatternApplicationLog.created_at.desc()).limit(limit).all()
-    return PatternListResponse(
-        ok=True, patterns=[PatternItem.model_validate(p) for p in patterns]
+    return ORJSONResponse(
+        {"ok": True, "patterns": _rows_to_dicts(patterns, PATTERN_ITEM_FIELDS)}
     )
 
 
 @app.post("/v1/patterns/{pattern_id}/approve", response_model=PatternActionResponse)
-async def approve_pattern(
+def approve_pattern(
     pattern_id: UUID,
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user),
@@ -1734,6 +2155,7 @@ async def approve_pattern(
     """Approve a pending pattern (admin only)"""
     pattern = (
         db.query(PatternApplicationLog)
+        .options(raiseload("*"))
         .filter(PatternApplicationLog.id == pattern_id)
         .first()
     )
@@ -1768,7 +2190,7 @@ async def approve_pattern(
 
 
 @app.post("/v1/patterns/{pattern_id}/reject", response_model=PatternActionResponse)
-async def reject_pattern(
+def reject_pattern(
     pattern_id: UUID,
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user),
@@ -1776,6 +2198,7 @@ async def reject_pattern(
     """Reject a pending pattern (admin only)"""
     pattern = (
         db.query(PatternApplicationLog)
+        .options(raiseload("*"))
         .filter(PatternApplicationLog.id == pattern_id)
         .first()
     )
@@ -1810,18 +2233,32 @@ async def reject_pattern(
 
 
 @app.post("/v1/patterns/apply", response_model=PatternApplyResponse)
-async def apply_approved_patterns(
+def apply_approved_patterns(
     db: Session = Depends(get_db),
     admin_user: User = Depends(get_admin_user),
 ):
     """Apply all approved patterns to the system (admin only)"""
-    approved_patterns = (
-        db.query(PatternApplicationLog)
-        .filter(PatternApplicationLog.status == "approved")
+    now = get_kst_now()
+    # One atomic UPDATE ... RETURNING marks every approved pattern applied and
+    # reports their types; no rows are loaded into the session
+    applied_types = (
+        db.execute(
+            update(PatternApplicationLog)
+            .where(PatternApplicationLog.status == "approved")
+            .values(
+                status="applied",
+                applied_at=now,
+                application_result={"applied_by": admin_user.id},
+            )
+            .returning(PatternApplicationLog.pattern_type)
+            .execution_options(synchronize_session=False)
+        )
+        .scalars()
         .all()
     )
 
-    if not approved_patterns:
+    if not applied_types:
+        db.rollback()
         return PatternApplyResponse(
             ok=True,
             applied={
@@ -1832,40 +2269,16 @@ async def apply_approved_patterns(
             },
         )
 
-    results = {
-        "skip_llm_patterns": 0,
-        "internal_markers": 0,
-        "new_intents": 0,
-        "errors": [],
-    }
-    now = get_kst_now()
-
-    for pattern in approved_patterns:
-        try:
-            pattern.status = "applied"
-            pattern.applied_at = now
-            pattern.application_result = {"applied_by": admin_user.id}
-
-            if pattern.pattern_type == "skip_llm":
-                results["skip_llm_patterns"] += 1
-            elif pattern.pattern_type == "internal_marker":
-                results["internal_markers"] += 1
-            elif pattern.pattern_type == "new_intent":
-                results["new_intents"] += 1
-
-        except Exception as e:
-            results["errors"].append({"pattern_id": str(pattern.id), "error": str(e)})
-
+    type_counts = Counter(applied_types)
     db.commit()
 
     return PatternApplyResponse(
         ok=True,
         applied={
-            "skip_llm_patterns": results["skip_llm_patterns"],
-            "internal_markers": results["internal_markers"],
-            "new_intents": results["new_intents"],
+            "skip_llm_patterns": type_counts["skip_llm"],
+            "internal_markers": type_counts["internal_marker"],
+            "new_intents": type_counts["new_intent"],
             "applied_at": now.isoformat(),
-            "errors": results["errors"] if results["errors"] else None,
         },
     )
 
@@ -1876,7 +2289,7 @@ async def apply_approved_patterns(
 
 
 @app.get("/v1/learning/stats")
-async def get_learning_stats(
+def get_learning_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -1913,27 +2326,29 @@ async def get_learning_stats(
         .all()
     )
 
-    return {
-        "ok": True,
-        "accuracy_trend": [
-            {
-                "version": v.version,
-                "created_at": v.created_at.isoformat() if v.created_at else None,
-                "accuracy_score": float(v.accuracy_score) if v.accuracy_score else None,
-                "auto_approved_patterns": v.auto_approved_patterns_count or 0,
-                "logs_analyzed": v.logs_analyzed_count or 0,
-            }
-            for v in reversed(versions)
-        ],
-        "pattern_summary": {
-            "auto_approved_total": auto_approved_total,
-            "by_status": {row.status: row.count for row in pattern_stats},
-        },
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "accuracy_trend": [
+                {
+                    "version": v.version,
+                    "created_at": v.created_at,
+                    "accuracy_score": float(v.accuracy_score) if v.accuracy_score else None,
+                    "auto_approved_patterns": v.auto_approved_patterns_count or 0,
+                    "logs_analyzed": v.logs_analyzed_count or 0,
+                }
+                for v in reversed(versions)
+            ],
+            "pattern_summary": {
+                "auto_approved_total": auto_approved_total,
+                "by_status": {row.status: row.count for row in pattern_stats},
+            },
+        }
+    )
 
 
 @app.get("/v1/learning/insights", response_model=InsightsResponse)
-async def get_learning_insights(
+def get_learning_insights(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -1965,7 +2380,7 @@ async def get_learning_insights(
 
 
 @app.get("/v1/staff/highlights")
-async def get_highlighted_responses(
+def get_highlighted_responses(
     limit: int = Query(20, ge=1, le=100),
     staff_member: Optional[str] = Query(None),
     db: Session = Depends(get_db),
@@ -1983,30 +2398,32 @@ async def get_highlighted_responses(
         .all()
     )
 
-    return {
-        "ok": True,
-        "highlights": [
-            {
-                "id": h.id,
-                "staff_member": h.staff_member,
-                "clinic_key": h.clinic_key,
-                "customer_text_snippet": h.customer_text_snippet,
-                "response_text_snippet": h.response_text_snippet,
-                "customer_intent": h.customer_intent,
-                "customer_topic": h.customer_topic,
-                "response_delay_sec": h.response_delay_sec,
-                "response_position": h.response_position,
-                "highlight_reason": h.highlight_reason,
-                "created_at": h.created_at.isoformat() if h.created_at else None,
-            }
-            for h in highlights
-        ],
-        "total": len(highlights),
-    }
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "highlights": [
+                {
+                    "id": h.id,
+                    "staff_member": h.staff_member,
+                    "clinic_key": h.clinic_key,
+                    "customer_text_snippet": h.customer_text_snippet,
+                    "response_text_snippet": h.response_text_snippet,
+                    "customer_intent": h.customer_intent,
+                    "customer_topic": h.customer_topic,
+                    "response_delay_sec": h.response_delay_sec,
+                    "response_position": h.response_position,
+                    "highlight_reason": h.highlight_reason,
+                    "created_at": h.created_at,
+                }
+                for h in highlights
+            ],
+            "total": len(highlights),
+        }
+    )
 
 
 @app.get("/v1/staff/response-stats", response_model=StaffResponseStatsResponse)
-async def get_staff_response_stats(
+def get_staff_response_stats(
     days: int = Query(30, ge=1, le=365, description="Period in days"),
     clinic_key: Optional[str] = Query(None, description="Filter by clinic"),
     db: Session = Depends(get_db),
@@ -2056,7 +2473,7 @@ async def get_staff_response_stats(
 
 
 @app.get("/v1/staff/response-log", response_model=StaffResponseLogResponse)
-async def get_staff_response_log(
+def get_staff_response_log(
     staff_member: Optional[str] = Query(None, description="Filter by staff name"),
     clinic_key: Optional[str] = Query(None, description="Filter by clinic"),
     limit: int = Query(50, ge=1, le=200),
@@ -2095,7 +2512,7 @@ async def get_staff_response_log(
 
 
 @app.get("/v1/staff-analysis/latest", response_model=StaffAnalysisResponse)
-async def get_latest_staff_analysis(
+def get_latest_staff_analysis(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -2125,7 +2542,7 @@ async def get_latest_staff_analysis(
 
 
 @app.get("/v1/staff-analysis/insights", response_model=StaffInsightsResponse)
-async def get_staff_analysis_insights(
+def get_staff_analysis_insights(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -2174,7 +2591,7 @@ async def get_staff_analysis_insights(
 
 
 @app.get("/v1/staff-analysis/history", response_model=StaffAnalysisHistoryResponse)
-async def get_staff_analysis_history(
+def get_staff_analysis_history(
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -2197,6 +2614,7 @@ async def get_staff_analysis_history(
 
 @app.post("/v1/staff-analysis/run")
 async def trigger_staff_analysis(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user),
 ):
@@ -2206,18 +2624,17 @@ async def trigger_staff_analysis(
     try:
         worker_secret = os.environ.get("WORKER_SECRET", "")
         headers = {"X-Worker-Secret": worker_secret} if worker_secret else {}
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{worker_url}/staff-analysis/run", headers=headers
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {
-                    "ok": False,
-                    "status": "error",
-                    "message": f"Worker returned status {response.status_code}",
-                }
+        response = await request.app.state.http.post(
+            f"{worker_url}/staff-analysis/run", headers=headers
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return {
+                "ok": False,
+                "status": "error",
+                "message": f"Worker returned status {response.status_code}",
+            }
     except httpx.RequestError as e:
         # Fallback: try to run locally if worker is not accessible
         logger.warning(f"Worker not accessible ({e}), trying local staff analysis...")
@@ -20,7 +20,7 @@ from sqlalchemy.exc import IntegrityError
 from shared.database import get_db, engine, Base
 from shared.models import MessageEvent, DeviceHeartbeat
 from shared.schemas import EventCreate, EventResponse, HeartbeatRequest, HeartbeatResponse, ErrorResponse
-from shared.utils import classify_sender, get_bucket_ts, hash_text, get_kst_now
+from shared.utils import KST, classify_sender, get_bucket_ts, hash_text, get_kst_now
 from shared.config import get_settings
 
 
@@ -33,7 +33,8 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Create tables if not exist
-    Base.metadata.create_all(bind=engine)
+    if settings.db_create_all:
+        Base.metadata.create_all(bind=engine)
     yield
     # Shutdown
 
@@ -72,7 +73,7 @@ async def health_check():
 
 
 @app.post("/v1/events", response_model=EventResponse)
-async def create_event(
+def create_event(
     event: EventCreate,
     db: Session = Depends(get_db),
     device_key: str = Depends(verify_device_key)
@@ -90,8 +91,7 @@ async def create_event(
     # Ensure received_at is timezone-aware for safe comparison
     received_at = event.received_at
     if received_at.tzinfo is None:
-        import pytz
-        received_at = pytz.timezone("Asia/Seoul").localize(received_at)
+        received_at = received_at.replace(tzinfo=KST)
     max_future = now + timedelta(minutes=5)
     max_past = now - timedelta(days=7)
     if received_at > max_future or received_at < max_past:
@@ -160,7 +160,7 @@ async def create_event(
 
 
 @app.post("/v1/heartbeat", response_model=HeartbeatResponse)
-async def heartbeat(
+def heartbeat(
     request: HeartbeatRequest,
     db: Session = Depends(get_db),
     device_key: str = Depends(verify_device_key)
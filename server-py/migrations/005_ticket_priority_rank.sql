@@ -0,0 +1,20 @@
+-- Migration 005: Persisted priority rank for ticket list ordering
+-- Date: 2026-10-16
+-- Replaces the per-request CASE(priority) sort with an indexed integer column
+-- CONCURRENTLY avoids blocking ticket writes; run outside a transaction block.
+
+-- 1. Ticket: Add priority_rank (urgent=0, high=1, normal=2, low=3)
+ALTER TABLE ticket ADD COLUMN IF NOT EXISTS priority_rank INTEGER NOT NULL DEFAULT 2;
+
+-- 2. Backfill from existing priority values
+UPDATE ticket
+SET priority_rank = CASE priority
+    WHEN 'urgent' THEN 0
+    WHEN 'high' THEN 1
+    WHEN 'normal' THEN 2
+    WHEN 'low' THEN 3
+    ELSE 4
+END;
+
+-- 3. Composite index matching the dashboard list ORDER BY
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ticket_list_order ON ticket (sla_breached DESC, priority_rank, updated_at DESC, ticket_id);
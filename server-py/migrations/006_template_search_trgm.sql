@@ -0,0 +1,15 @@
+-- Migration 006: Trigram indexes for template search
+-- Date: 2026-10-16
+-- list_templates searches title/content with ILIKE '%...%'; pg_trgm GIN indexes let
+-- Postgres serve those substring matches from an index instead of a sequential scan.
+-- (Full-text tsvector search is not used: it matches whole tokens, which would break
+-- substring search on Korean template text.)
+-- This file is the only place these indexes are created: they are not declared on the
+-- model and the services do not build them at startup.
+
+-- 1. Extension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 2. MessageTemplate: trigram indexes on searchable columns
+CREATE INDEX IF NOT EXISTS ix_template_title_trgm ON message_template USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_template_content_trgm ON message_template USING gin (content gin_trgm_ops);
@@ -0,0 +1,12 @@
+-- Migration 007: Partial indexes for dashboard metrics
+-- Date: 2026-10-16
+-- get_metrics / get_clinics_health count today's inbound messages per chat room and
+-- urgent / SLA-breached tickets. Partial indexes keep those scans on the hot subset.
+-- CONCURRENTLY avoids blocking ingest writes; run outside a transaction block.
+-- (SLA-breached tickets are already covered by ix_ticket_sla_breached.)
+
+-- 1. MessageEvent: inbound messages by time, covering chat_room for the per-clinic GROUP BY
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_event_inbound_received ON message_event (received_at, chat_room) WHERE direction = 'inbound';
+
+-- 2. Ticket: urgent tickets (global count and per-clinic count)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ticket_urgent ON ticket (clinic_key) WHERE priority = 'urgent';
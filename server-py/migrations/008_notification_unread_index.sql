@@ -0,0 +1,7 @@
+-- Migration 008: Partial index for unread notifications
+-- Date: 2026-10-16
+-- mark_all_notifications_read updates the unread rows for (user_id = :uid OR user_id IS NULL).
+-- Read notifications pile up over time; indexing only the unread ones keeps this index tiny.
+-- CONCURRENTLY avoids blocking notification writes; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notification_unread ON notification (user_id) WHERE is_read = FALSE;
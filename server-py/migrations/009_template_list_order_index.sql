@@ -0,0 +1,7 @@
+-- Migration 009: Index for the template list sort key
+-- Date: 2026-10-16
+-- list_templates orders by (usage_count DESC, updated_at DESC, id DESC) and pages with a
+-- keyset cursor on the same columns, so each page is a short range read of this index.
+-- CONCURRENTLY avoids blocking template writes; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_template_list_order ON message_template (usage_count DESC, updated_at DESC, id DESC);
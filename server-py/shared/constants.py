@@ -220,9 +220,21 @@ def build_needs_reply_guide() -> str:
 
 
 TEMPLATE_CATEGORIES = ["인사", "안내", "문제해결", "마무리", "기타"]
+# 검증용 (O(1) 멤버십) / 에러 메시지용 문자열 - 요청마다 재생성하지 않음
+TEMPLATE_CATEGORY_SET = frozenset(TEMPLATE_CATEGORIES)
+TEMPLATE_CATEGORIES_DISPLAY = ", ".join(TEMPLATE_CATEGORIES)
 
 TICKET_STATUSES = ["onboarding", "stable", "churn_risk", "important"]
+TICKET_STATUS_SET = frozenset(TICKET_STATUSES)
+TICKET_STATUSES_DISPLAY = ", ".join(TICKET_STATUSES)
 
 TICKET_PRIORITIES = ["low", "normal", "high", "urgent"]
+TICKET_PRIORITY_SET = frozenset(TICKET_PRIORITIES)
+TICKET_PRIORITIES_DISPLAY = ", ".join(TICKET_PRIORITIES)
+
+# 목록 정렬용 우선순위 순위 (낮을수록 먼저) - ticket.priority_rank 컬럼에 저장
+TICKET_PRIORITY_RANKS = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
 
 USER_ROLES = ["admin", "member"]
+USER_ROLE_SET = frozenset(USER_ROLES)
+USER_ROLES_DISPLAY = ", ".join(USER_ROLES)
@@ -1,17 +1,67 @@
+import logging
 import os
-from sqlalchemy import create_engine
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool, StaticPool
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./cs_dev.db")
 
 # SQLite specific settings
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    # In-memory DBs live inside one connection, so share it (StaticPool);
+    # file DBs open a connection per session to avoid holding write locks (NullPool)
+    is_memory = DATABASE_URL in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in DATABASE_URL
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool if is_memory else NullPool,
+    )
 else:
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_size=10, max_overflow=20)
+    engine = create_engine(
+        DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        # Reuse the most recently returned connection so idle extras age out
+        # via pool_recycle instead of all staying warm at low traffic
+        pool_use_lifo=True,
+        # Room for every distinct statement shape across the API/worker so compiled
+        # SQL stays cached (SQLAlchemy's default is 500 entries)
+        query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
+    )
+
+# Statements slower than this are logged with their source (0 disables)
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "100"))
+
+# What issued the current queries (e.g. "GET /v1/tickets"); set per request by the API
+query_source: ContextVar[str] = ContextVar("query_source", default="-")
+
+if SLOW_QUERY_MS > 0:
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start"]) * 1000
+        if elapsed_ms >= SLOW_QUERY_MS:
+            logger.warning(
+                "[SlowQuery] %.0fms %s: %s",
+                elapsed_ms,
+                query_source.get(),
+                " ".join(statement.split())[:500],
+            )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -37,29 +37,56 @@ COLUMN_MIGRATIONS = [
     ("ticket", "resolved_at", "ALTER TABLE ticket ADD COLUMN resolved_at TIMESTAMPTZ"),
     ("staff_response_log", "is_highlighted", "ALTER TABLE staff_response_log ADD COLUMN is_highlighted BOOLEAN NOT NULL DEFAULT FALSE"),
     ("staff_response_log", "highlight_reason", "ALTER TABLE staff_response_log ADD COLUMN highlight_reason TEXT"),
+    # 005: Persisted priority rank for ticket list ordering
+    ("ticket", "priority_rank", "ALTER TABLE ticket ADD COLUMN priority_rank INTEGER NOT NULL DEFAULT 2"),
 ]
 
 
+def _existing_columns(db: Session, tables: set[str]) -> set[tuple[str, str]]:
+    """Return (table, column) pairs present on the given tables, in one catalog query"""
+    rows = db.execute(
+        text("""
+            SELECT c.relname, a.attname
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            WHERE c.relname = ANY(:tables)
+              AND c.relkind = 'r'
+              AND pg_catalog.pg_table_is_visible(c.oid)
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+        """),
+        {"tables": sorted(tables)},
+    )
+    return {(table, column) for table, column in rows}
+
+
 def run_column_migrations(db: Session) -> None:
     """Run database migrations for new columns"""
     if _is_sqlite(db):
         return
+    try:
+        existing = _existing_columns(db, {table for table, _, _ in COLUMN_MIGRATIONS})
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[CRITICAL] Column migration check failed: {e}")
+        logger.error(traceback.format_exc())
+        return
+
     for table, column, sql in COLUMN_MIGRATIONS:
+        if (table, column) in existing:
+            continue
         try:
-            # Check if column exists
-            check_sql = text(f"""
-                SELECT column_name FROM information_schema.columns
-                WHERE table_name = '{table}' AND column_name = '{column}'
-            """)
-            result = db.execute(check_sql).fetchone()
-            if not result:
-                db.execute(text(sql))
-                db.commit()
-                logger.info(f"Migration: Added {column} to {table}")
+            db.execute(text(sql))
+            db.commit()
+            logger.info(f"Migration: Added {column} to {table}")
         except Exception as e:
             db.rollback()
             logger.error(f"[CRITICAL] Migration failed for {table}.{column}: {e}")
             logger.error(traceback.format_exc())
+            continue
+        # New column starts at its DEFAULT; fill it from existing data once
+        if (table, column) == ("ticket", "priority_rank"):
+            backfill_ticket_priority_rank(db)
 
 
 def drop_old_status_constraint(db: Session) -> None:
@@ -169,6 +196,41 @@ def fix_existing_tickets_needs_reply(db: Session) -> None:
         logger.error(traceback.format_exc())
 
 
+def backfill_ticket_priority_rank(db: Session) -> None:
+    """Sync ticket.priority_rank with priority for rows written before the column existed
+
+    Runs once, right after run_column_migrations adds the column (or via migration 005);
+    later writes keep it in sync through Ticket's priority validator.
+    """
+    if _is_sqlite(db):
+        return
+    try:
+        result = db.execute(text("""
+            UPDATE ticket
+            SET priority_rank = CASE priority
+                WHEN 'urgent' THEN 0
+                WHEN 'high' THEN 1
+                WHEN 'normal' THEN 2
+                WHEN 'low' THEN 3
+                ELSE 4
+            END
+            WHERE priority_rank IS DISTINCT FROM CASE priority
+                WHEN 'urgent' THEN 0
+                WHEN 'high' THEN 1
+                WHEN 'normal' THEN 2
+                WHEN 'low' THEN 3
+                ELSE 4
+            END
+        """))
+        db.commit()
+        if result.rowcount > 0:
+            logger.info(f"Backfilled priority_rank for {result.rowcount} tickets")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[CRITICAL] Migration failed (priority_rank backfill): {e}")
+        logger.error(traceback.format_exc())
+
+
 def run_table_migrations(db: Session) -> None:
     """Create new tables if they don't exist"""
     if _is_sqlite(db):
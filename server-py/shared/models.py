@@ -15,9 +15,10 @@ from sqlalchemy import (
     JSON,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.types import TypeDecorator, CHAR
 from .database import Base, DATABASE_URL
+from .constants import TICKET_PRIORITY_RANKS
 
 
 # Custom UUID type that works with SQLite
@@ -115,6 +116,12 @@ class MessageEvent(Base):
         Index("ix_message_event_room_time", "chat_room", "received_at"),
         Index("ix_message_event_sender_type_time", "sender_type", "received_at"),
         Index("ix_message_event_created", "created_at"),
+        Index(
+            "ix_message_event_inbound_received",
+            "received_at",
+            "chat_room",
+            postgresql_where="direction = 'inbound'",
+        ),
     )
 
 
@@ -129,6 +136,9 @@ class Ticket(Base):
     priority = Column(
         Text, nullable=False, default="normal"
     )  # low, normal, high, urgent
+    priority_rank = Column(
+        Integer, nullable=False, default=2
+    )  # urgent=0 .. low=3, kept in sync with priority for list ordering
     topic_primary = Column(Text, nullable=True)
     summary_latest = Column(Text, nullable=True)
     next_action = Column(Text, nullable=True)
@@ -159,11 +169,18 @@ class Ticket(Base):
     )
 
     # Relationships
+    # passive_deletes: child rows are removed by the FK's ON DELETE CASCADE
     event_links = relationship(
-        "TicketEventLink", back_populates="ticket", cascade="all, delete-orphan"
+        "TicketEventLink",
+        back_populates="ticket",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     alerts = relationship(
-        "SLAAlertLog", back_populates="ticket", cascade="all, delete-orphan"
+        "SLAAlertLog",
+        back_populates="ticket",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     __table_args__ = (
@@ -181,11 +198,28 @@ class Ticket(Base):
             "sla_breached",
             postgresql_where="sla_breached = TRUE",
         ),
+        Index(
+            "ix_ticket_urgent",
+            "clinic_key",
+            postgresql_where="priority = 'urgent'",
+        ),
         Index("ix_ticket_updated", "updated_at"),
         Index("ix_ticket_first_inbound", "first_inbound_at"),
         Index("ix_ticket_resolution", "resolution_status"),
+        Index(
+            "ix_ticket_list_order",
+            sla_breached.desc(),
+            priority_rank,
+            updated_at.desc(),
+            ticket_id,
+        ),
     )
 
+    @validates("priority")
+    def _sync_priority_rank(self, key, value):
+        self.priority_rank = TICKET_PRIORITY_RANKS.get(value, len(TICKET_PRIORITY_RANKS))
+        return value
+
 
 class TicketEventLink(Base):
     __tablename__ = "ticket_event_link"
@@ -357,6 +391,12 @@ class MessageTemplate(Base):
         ),
         Index("ix_template_category", "category"),
         Index("ix_template_usage", "usage_count"),
+        Index(
+            "ix_template_list_order",
+            usage_count.desc(),
+            updated_at.desc(),
+            id.desc(),
+        ),
     )
 
 
@@ -384,6 +424,11 @@ class Notification(Base):
             name="ck_notification_type",
         ),
         Index("ix_notification_user_read", "user_id", "is_read"),
+        Index(
+            "ix_notification_unread",
+            "user_id",
+            postgresql_where="is_read = FALSE",
+        ),
         Index("ix_notification_created", "created_at"),
     )
 
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, Any
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # ============================================
@@ -146,6 +146,12 @@ class TicketBase(BaseModel):
     class Config:
         from_attributes = True
 
+    @field_validator("needs_reply", mode="before")
+    @classmethod
+    def _needs_reply_default(cls, v):
+        # Rows created before the needs_reply migration may still hold NULL
+        return True if v is None else v
+
 
 class TicketItem(TicketBase):
     """Ticket list item with calculated SLA remaining"""
@@ -156,8 +162,10 @@ class TicketItem(TicketBase):
 class TicketListResponse(BaseModel):
     ok: bool = True
     tickets: list[TicketItem]
-    total: int
+    total: int | None = None  # None when requested with include_total=false
     page: int
+    has_more: bool = False
+    next_cursor: str | None = None  # keyset cursor for the next page (None on the last page)
 
 
 class TicketDetail(TicketBase):
@@ -309,6 +317,8 @@ class TemplateItem(BaseModel):
 class TemplateListResponse(BaseModel):
     ok: bool = True
     templates: list[TemplateItem]
+    has_more: bool = False
+    next_cursor: str | None = None  # keyset cursor for the next page (None on the last page)
 
 
 class TemplateResponse(BaseModel):
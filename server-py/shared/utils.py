@@ -5,11 +5,13 @@ import logging
 import threading
 from datetime import datetime
 from typing import Optional, Tuple, Dict, List
-import pytz
+from zoneinfo import ZoneInfo
 
 from .constants import COMPILED_SKIP_PATTERNS, get_needs_reply
 
-KST = pytz.timezone("Asia/Seoul")
+KST = ZoneInfo("Asia/Seoul")
+# Korea has no DST, so the offset is fixed (used where SQL needs a plain number)
+KST_UTC_OFFSET_SEC = 9 * 3600
 logger = logging.getLogger(__name__)
 
 # 동적 패턴 캐시 (DB에서 학습된 패턴)
@@ -68,7 +70,7 @@ def get_bucket_ts(ts: datetime) -> datetime:
         10:42:25 -> 10:42:20
     """
     if ts.tzinfo is None:
-        ts = KST.localize(ts)
+        ts = ts.replace(tzinfo=KST)
 
     # Truncate to minute and add 10-second bucket
     minute_start = ts.replace(second=0, microsecond=0)
@@ -102,6 +104,11 @@ def get_kst_now() -> datetime:
     return datetime.now(KST)
 
 
+def get_kst_today_start() -> datetime:
+    """Get midnight (00:00) of the current KST day, timezone-aware."""
+    return datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 def calculate_sla_remaining_sec(first_inbound_at: Optional[datetime], first_response_sec: Optional[int], sla_minutes: int = 20) -> Optional[int]:
     """
     Calculate remaining SLA time in seconds.
@@ -119,7 +126,7 @@ def calculate_sla_remaining_sec(first_inbound_at: Optional[datetime], first_resp
 
     now = get_kst_now()
     if first_inbound_at.tzinfo is None:
-        first_inbound_at = KST.localize(first_inbound_at)
+        first_inbound_at = first_inbound_at.replace(tzinfo=KST)
 
     elapsed = (now - first_inbound_at).total_seconds()
     threshold = sla_minutes * 60
@@ -0,0 +1,50 @@
+"""
+Shared fixtures: a throwaway SQLite database swapped in for the app's engine
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+import dashboard_api.main as dashboard_main
+import shared.database as database
+from shared.database import Base, SessionLocal
+
+
+@pytest.fixture
+def db_engine(tmp_path, monkeypatch):
+    """SQLite engine on a per-test file, bound to every session the app opens"""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    engine = create_engine(
+        url, connect_args={"check_same_thread": False}, poolclass=NullPool
+    )
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(dashboard_main, "engine", engine)
+    monkeypatch.setitem(SessionLocal.kw, "bind", engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db_engine):
+    with TestClient(dashboard_main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def auth_headers(client):
+    """Bearer header for the bootstrapped admin user"""
+    response = client.post("/auth/login", json={"email": "admin", "password": "1234"})
+    return {"Authorization": f"Bearer {response.json()['token']}"}
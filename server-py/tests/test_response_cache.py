@@ -0,0 +1,71 @@
+"""
+ResponseCache single-flight behaviour under concurrent callers
+"""
+
+import threading
+import time
+
+from dashboard_api.cache import ResponseCache
+
+
+def test_get_or_set_computes_once_for_concurrent_callers():
+    cache = ResponseCache(ttl=60)
+    calls = []
+    results = []
+    start = threading.Barrier(16)
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 42}
+
+    def caller():
+        start.wait()
+        results.append(cache.get_or_set("metrics", compute))
+
+    threads = [threading.Thread(target=caller) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 16
+    assert cache._inflight == {}
+
+
+def test_get_or_set_never_overlaps_computations_for_a_key():
+    cache = ResponseCache(ttl=60)
+    state = {"active": 0, "peak": 0}
+    state_lock = threading.Lock()
+
+    def compute():
+        with state_lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with state_lock:
+            state["active"] -= 1
+        # Not cacheable, so each caller computes in turn under the key lock
+        return None
+
+    # Callers keep arriving while earlier ones are still waiting, so late
+    # arrivals must queue on the existing key lock rather than a fresh one
+    threads = []
+    for _ in range(12):
+        thread = threading.Thread(target=cache.get_or_set, args=("health", compute))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert state["peak"] == 1
+    assert cache._inflight == {}
+
+
+def test_get_or_set_recomputes_after_clear():
+    cache = ResponseCache(ttl=60)
+    assert cache.get_or_set("metrics", lambda: 1) == 1
+    cache.clear()
+    assert cache.get_or_set("metrics", lambda: 2) == 2
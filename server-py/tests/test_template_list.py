@@ -0,0 +1,72 @@
+"""
+Template list: unbounded by default, keyset pages when a limit is given
+"""
+
+import base64
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from shared.models import MessageTemplate
+
+
+def test_list_templates_without_limit_returns_every_template(client, auth_headers, db):
+    db.add_all(
+        MessageTemplate(title=f"template {i}", content="x", usage_count=i % 7)
+        for i in range(205)
+    )
+    db.commit()
+
+    body = client.get("/v1/templates", headers=auth_headers).json()
+
+    assert len(body["templates"]) == 205
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+
+
+def test_template_cursor_pages_cover_every_template_once_in_order(client, auth_headers, db):
+    updated_at = datetime(2026, 10, 1, 9, 0, 0)
+    rows = [
+        # Few distinct usage counts and timestamps, so ties fall through to id
+        MessageTemplate(
+            title=f"template {i}",
+            content="x",
+            usage_count=i % 3,
+            updated_at=updated_at + timedelta(minutes=i % 2),
+        )
+        for i in range(17)
+    ]
+    db.add_all(rows)
+    db.commit()
+    expected = [
+        t.id
+        for t in sorted(rows, key=lambda t: (t.usage_count, t.updated_at, t.id), reverse=True)
+    ]
+
+    seen = []
+    params = {"limit": 4}
+    while True:
+        body = client.get("/v1/templates", params=params, headers=auth_headers).json()
+        seen += [t["id"] for t in body["templates"]]
+        if not body["has_more"]:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert seen == expected
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor!!",
+        base64.urlsafe_b64encode(orjson.dumps([1, "2026-10-01T09:00:00"])).decode(),
+        base64.urlsafe_b64encode(orjson.dumps(["x", "2026-10-01T09:00:00", 1])).decode(),
+        base64.urlsafe_b64encode(orjson.dumps([1, "yesterday", 1])).decode(),
+    ],
+)
+def test_malformed_template_cursor_is_rejected(client, auth_headers, cursor):
+    response = client.get("/v1/templates", params={"cursor": cursor}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"]["code"] == "VALIDATION_ERROR"
@@ -0,0 +1,92 @@
+"""
+Ticket delete removes dependent rows (SQLite runs without FK enforcement)
+"""
+
+import uuid
+from datetime import datetime
+
+from shared.models import (
+    ClassificationFeedback,
+    LLMAnnotation,
+    MessageEvent,
+    SLAAlertLog,
+    StaffResponseLog,
+    Ticket,
+    TicketEventLink,
+)
+
+DEPENDENTS = (TicketEventLink, SLAAlertLog, ClassificationFeedback, StaffResponseLog)
+
+
+def _ticket_with_dependents(db, clinic_key: str) -> uuid.UUID:
+    now = datetime(2026, 10, 1, 9, 0, 0)
+    ticket = Ticket(ticket_id=uuid.uuid4(), clinic_key=clinic_key)
+    event = MessageEvent(
+        event_id=uuid.uuid4(),
+        device_id="device",
+        chat_room=clinic_key,
+        sender_name="고객",
+        sender_type="customer",
+        direction="inbound",
+        text_raw="안녕하세요",
+        text_hash=uuid.uuid4().hex,
+        bucket_ts=now,
+        received_at=now,
+    )
+    db.add_all([ticket, event])
+    db.flush()
+    db.add_all(
+        [
+            TicketEventLink(ticket_id=ticket.ticket_id, event_id=event.event_id),
+            SLAAlertLog(ticket_id=ticket.ticket_id),
+            ClassificationFeedback(
+                event_id=event.event_id,
+                ticket_id=ticket.ticket_id,
+                original_intent="질문",
+                original_needs_reply=True,
+            ),
+            StaffResponseLog(
+                event_id=event.event_id,
+                ticket_id=ticket.ticket_id,
+                staff_member="모션랩스_담당",
+                clinic_key=clinic_key,
+            ),
+            LLMAnnotation(target_type="ticket", target_id=ticket.ticket_id, model="test"),
+        ]
+    )
+    db.commit()
+    return ticket.ticket_id
+
+
+def _counts(db, ticket_id: uuid.UUID) -> dict:
+    counts = {
+        model.__name__: db.query(model).filter(model.ticket_id == ticket_id).count()
+        for model in DEPENDENTS
+    }
+    counts["LLMAnnotation"] = (
+        db.query(LLMAnnotation)
+        .filter(LLMAnnotation.target_type == "ticket", LLMAnnotation.target_id == ticket_id)
+        .count()
+    )
+    counts["Ticket"] = db.query(Ticket).filter(Ticket.ticket_id == ticket_id).count()
+    return counts
+
+
+def test_delete_ticket_removes_dependent_rows(client, auth_headers, db):
+    deleted_id = _ticket_with_dependents(db, "delete-me")
+    kept_id = _ticket_with_dependents(db, "keep-me")
+
+    response = client.delete(f"/v1/tickets/{deleted_id}", headers=auth_headers)
+
+    assert response.status_code == 200
+    db.expire_all()
+    assert set(_counts(db, deleted_id).values()) == {0}
+    assert set(_counts(db, kept_id).values()) == {1}
+    # Message events are shared history, not owned by the ticket
+    assert db.query(MessageEvent).count() == 2
+
+
+def test_delete_missing_ticket_is_404(client, auth_headers):
+    response = client.delete(f"/v1/tickets/{uuid.uuid4()}", headers=auth_headers)
+
+    assert response.status_code == 404
@@ -0,0 +1,102 @@
+"""
+Ticket list keyset pagination over the mixed ASC/DESC sort key
+"""
+
+import base64
+import uuid
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+
+from shared.models import Ticket
+
+PRIORITIES = ["urgent", "high", "normal", "low"]
+
+
+@pytest.fixture
+def tickets(db):
+    """23 tickets with both SLA states, every priority and shared updated_at values"""
+    base = datetime(2026, 10, 1, 9, 0, 0)
+    rows = [
+        Ticket(
+            ticket_id=uuid.uuid4(),
+            clinic_key="paging",
+            priority=PRIORITIES[i % 4],
+            sla_breached=i % 5 == 0,
+            # Only three distinct timestamps, so most rows tie on updated_at
+            updated_at=base + timedelta(minutes=i % 3),
+        )
+        for i in range(23)
+    ]
+    db.add_all(rows)
+    db.commit()
+    # Expected list order: breached first, priority, newest first, then id
+    rows.sort(key=lambda t: (not t.sla_breached, t.priority_rank, -t.updated_at.timestamp(), t.ticket_id))
+    return [str(t.ticket_id) for t in rows]
+
+
+def _page_through(client, headers, limit, **params):
+    seen = []
+    cursor = None
+    for _ in range(50):
+        query = {"clinic_key": "paging", "limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        body = client.get("/v1/tickets", params=query, headers=headers).json()
+        seen += [t["ticket_id"] for t in body["tickets"]]
+        if not body["has_more"]:
+            assert body["next_cursor"] is None
+            return seen, body
+        cursor = body["next_cursor"]
+    raise AssertionError("pagination did not terminate")
+
+
+@pytest.mark.parametrize("limit", [1, 4, 7, 23])
+def test_cursor_pages_cover_every_ticket_once_in_order(client, auth_headers, tickets, limit):
+    seen, _ = _page_through(client, auth_headers, limit)
+
+    assert len(seen) == len(set(seen))
+    assert seen == tickets
+
+
+def test_cursor_pages_without_total(client, auth_headers, tickets):
+    seen, last = _page_through(client, auth_headers, 5, include_total="false")
+
+    assert seen == tickets
+    assert last["total"] is None
+
+
+def test_first_page_reports_total_and_cursor(client, auth_headers, tickets):
+    body = client.get(
+        "/v1/tickets", params={"clinic_key": "paging", "limit": 10}, headers=auth_headers
+    ).json()
+
+    assert body["total"] == 23
+    assert body["has_more"] is True
+    assert [t["ticket_id"] for t in body["tickets"]] == tickets[:10]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor!!",
+        base64.urlsafe_b64encode(b"{broken").decode(),
+        base64.urlsafe_b64encode(orjson.dumps([True, 1])).decode(),
+        base64.urlsafe_b64encode(orjson.dumps("text")).decode(),
+        base64.urlsafe_b64encode(
+            orjson.dumps([False, "x", "2026-10-01T09:00:00", str(uuid.uuid4())])
+        ).decode(),
+        base64.urlsafe_b64encode(
+            orjson.dumps([False, 1, "yesterday", str(uuid.uuid4())])
+        ).decode(),
+        base64.urlsafe_b64encode(
+            orjson.dumps([False, 1, "2026-10-01T09:00:00", "not-a-uuid"])
+        ).decode(),
+    ],
+)
+def test_malformed_cursor_is_rejected(client, auth_headers, cursor):
+    response = client.get("/v1/tickets", params={"cursor": cursor}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"]["code"] == "VALIDATION_ERROR"
@@ -0,0 +1,28 @@
+"""
+SLA remaining time in the ticket list (SQLite dev database)
+"""
+
+from datetime import timedelta
+
+from shared.config import get_settings
+from shared.models import Ticket
+from shared.utils import calculate_sla_remaining_sec, get_kst_now
+
+
+def test_sla_remaining_sec_treats_naive_values_as_kst(client, auth_headers, db):
+    sla_minutes = get_settings().sla_threshold_minutes
+    # Stored the way SQLite keeps it: naive KST wall-clock time, 10 minutes ago
+    first_inbound_at = (get_kst_now() - timedelta(minutes=10)).replace(tzinfo=None)
+    ticket = Ticket(clinic_key="sla-test", first_inbound_at=first_inbound_at)
+    db.add(ticket)
+    db.commit()
+
+    response = client.get("/v1/tickets?clinic_key=sla-test", headers=auth_headers)
+
+    assert response.status_code == 200
+    (item,) = response.json()["tickets"]
+    assert item["ticket_id"] == str(ticket.ticket_id)
+
+    expected = calculate_sla_remaining_sec(first_inbound_at, None, sla_minutes)
+    assert abs(item["sla_remaining_sec"] - expected) <= 5
+    assert abs(item["sla_remaining_sec"] - (sla_minutes - 10) * 60) <= 5
@@ -600,7 +600,8 @@ async def lifespan(app: FastAPI):
     global worker_thread, worker_started
 
     # Create tables if not exist
-    Base.metadata.create_all(bind=engine)
+    if settings.db_create_all:
+        Base.metadata.create_all(bind=engine)
 
     # Run migrations using shared module
     db = SessionLocal()